@@ -224,7 +224,7 @@ class ClubMembershipType(models.Model):
     @property
     def is_registration_open(self):
         """Check if registration is currently open for this type"""
-        today = timezone.localtime().date()
+        today = timezone.localdate()
         
         # Check opening date
         if self.registration_open_date and today < self.registration_open_date:
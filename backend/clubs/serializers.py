@@ -104,10 +104,15 @@ class ClubDetailSerializer(ClubInfoSerializer):
             'member_count',  # ✅ NEW!
         ]
     def get_member_count(self, obj):
-        """Count active club members"""
-        return obj.members.filter(
-            club_memberships__status=MembershipStatus.ACTIVE  # ✅ INTEGER constant!
-        ).distinct().count()
+        """
+        Count active club members
+        
+        ⚡ Counted on ClubMembership directly - (member, club) is unique, so
+        no User JOIN and no DISTINCT needed!
+        """
+        return obj.club_memberships.filter(
+            status=MembershipStatus.ACTIVE  # ✅ INTEGER constant!
+        ).count()
 
 class ClubSerializer(ClubDetailSerializer):
     '''
@@ -166,7 +171,6 @@ class ClubHomeSerializer(serializers.Serializer):
     
     def get_club_info(self, instance):
         """Return minimal club data using ClubInfoSerializer""" 
-        from clubs.serializers import ClubInfoSerializer
         club = instance.get('club')
         return ClubInfoSerializer(club).data
     
@@ -5,7 +5,7 @@
 # ========================================
 
 # Django imports
-from django.db.models import Q, Min, Exists, OuterRef
+from django.db.models import Exists, OuterRef
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 
@@ -179,7 +179,7 @@ class ClubViewSet(viewsets.ModelViewSet):
         
         club = self.get_object()
         # today = timezone.now().date()
-        today = timezone.localtime().date()
+        today = timezone.localdate()
         
         # ========================================
         # 1. LATEST ANNOUNCEMENT (just one!)
@@ -217,17 +217,9 @@ class ClubViewSet(viewsets.ModelViewSet):
                     is_cancelled=False
                 )
             ),
-            # ⚡ NEW: Find earliest session date
-            earliest_session_date=Min(
-                'all_occurrences__session_date',
-                filter=Q(
-                    all_occurrences__session_date__gte=today,
-                    all_occurrences__is_cancelled=False
-                )
-            )
-        ).filter(
+        ).with_earliest_session_date(today).filter(  # ⚡ Subquery - no JOIN over all occurrences
             has_upcoming_sessions=True
-        ).order_by('earliest_session_date').select_related('captain', 'club').first()  # ⚡ ORDER BY!
+        ).with_counts().with_recurring_sessions().with_skill_level().order_by('earliest_session_date').select_related('captain', 'club').first()  # ⚡ ORDER BY!
 
         # Serializer will call next_event.next_occurrence property automatically!
         
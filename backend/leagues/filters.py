@@ -1,5 +1,5 @@
 import django_filters
-from django.db.models import Exists, OuterRef, Q, Min, Max
+from django.db.models import Exists, OuterRef, Q, Max
 from django.utils import timezone
 
 from .models import League, SessionOccurrence, LeagueParticipation
@@ -83,7 +83,7 @@ class LeagueFilter(django_filters.FilterSet):
         if value == EventFilterStatus.ALL:
             return queryset
         
-        today = timezone.localtime().date()
+        today = timezone.localdate()
         
         if value == EventFilterStatus.UPCOMING:
             # ⚡ Find leagues with upcoming sessions
@@ -93,17 +93,12 @@ class LeagueFilter(django_filters.FilterSet):
                 is_cancelled=False
             )
             
+            # ⚡ For ordering by earliest upcoming session (subquery - no JOIN)
             return queryset.annotate(
                 has_upcoming=Exists(has_upcoming_sessions),
-                # ⚡ For ordering by earliest upcoming session
-                earliest_session_date=Min(
-                    'all_occurrences__session_date',
-                    filter=Q(
-                        all_occurrences__session_date__gte=today,
-                        all_occurrences__is_cancelled=False
-                    )
-                )
-            ).filter(has_upcoming=True).order_by('earliest_session_date')
+            ).with_earliest_session_date(today).filter(
+                has_upcoming=True
+            ).order_by('earliest_session_date')
             
         elif value == EventFilterStatus.PAST:
             # ⚡ Find leagues with NO future sessions
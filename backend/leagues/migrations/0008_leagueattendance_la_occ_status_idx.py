@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-17 00:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leagues', '0007_alter_league_minimum_skill_level_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='leagueattendance',
+            index=models.Index(fields=['session_occurrence', 'status'], name='la_occ_status_idx'),
+        ),
+    ]
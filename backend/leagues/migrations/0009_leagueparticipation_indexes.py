@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-17 01:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0019_alter_role_options_alter_role_club'),
+        ('leagues', '0008_leagueattendance_la_occ_status_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='leagueparticipation',
+            index=models.Index(fields=['league', 'status'], name='lp_league_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leagueparticipation',
+            index=models.Index(fields=['member', 'league', 'status'], name='lp_member_league_status_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-17 01:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0019_alter_role_options_alter_role_club'),
+        ('leagues', '0009_leagueparticipation_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='league',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-start_date', 'name'], name='league_active_start_idx'),
+        ),
+    ]
@@ -7,8 +7,10 @@ Follows DRY principle - DEFINE ONCE, REUSE EVERYWHERE!
 Created: 2026-02-01
 """
 
+import copy
+
 from rest_framework import serializers
-from users.serializers import UserInfoSerializer
+from public.constants import RecurrenceType
 
 class CaptainInfoMixin:
     """
@@ -46,9 +48,99 @@ class CaptainInfoMixin:
     captain_info = serializers.SerializerMethodField()
     
     def get_captain_info(self, obj):
-        """Reusable captain_info logic"""
-        captain = obj.captain if obj.captain else obj.created_by
-        if not captain:
+        """
+        Reusable captain_info logic
+        
+        ⚡ Memoized per request in context['_captain_cache'] (keyed by user id):
+        a captain running many leagues/events is built ONCE per response!
+        """
+        # ✅ Read the FK ids first - created_by is only touched without captain
+        # (League has no created_by → captain-less leagues have no captain_info)
+        captain_id = obj.captain_id or getattr(obj, 'created_by_id', None)
+        if not captain_id:
             return None
         
-        return UserInfoSerializer(captain).data
\ No newline at end of file
+        captain_cache = self.context.setdefault('_captain_cache', {})
+        captain_info = captain_cache.get(captain_id)
+        if captain_info is None:
+            captain = obj.captain if obj.captain_id else obj.created_by
+            # ⚡ Plain dict with the UserInfoSerializer fields - no serializer
+            # instance built (and bound) per row!
+            captain_info = {
+                'id': captain.id,
+                'first_name': captain.first_name,
+                'last_name': captain.last_name,
+                'full_name': captain.get_full_name(),
+                'username': captain.username,
+                'profile_picture_url': captain.profile_picture_url,
+            }
+            captain_cache[captain_id] = captain_info
+        
+        return captain_info
+
+
+class RecurringDaysMixin:
+    """
+    Mixin to add recurring_days field to any League serializer.
+    
+    ✅ USE THIS instead of duplicating get_recurring_days() logic!
+    
+    Reads league._recurring_sessions, prefetched by
+    League.objects.with_recurring_sessions() - NO query per league!
+    Falls back to a query if not prefetched (e.g. freshly created league).
+    
+    Output: [0, 2, 4] for Mon, Wed, Fri
+    Uses DayOfWeek constants: MON=0, TUE=1, WED=2, THU=3, FRI=4, SAT=5, SUN=6
+    
+    Used by:
+    - LeagueSerializer (EventCard)
+    - LeagueDetailSerializer (EventDetail)
+    - LeagueActivitySerializer (My Activities)
+    """
+    recurring_days = serializers.SerializerMethodField()
+    
+    def get_recurring_days(self, obj) -> list[int]:
+        """Reusable recurring_days logic (RECURRING sessions only, no ONCE)"""
+        recurring_sessions = getattr(obj, '_recurring_sessions', None)
+        if recurring_sessions is None:
+            recurring_sessions = obj.sessions.exclude(recurrence_type=RecurrenceType.ONCE)
+        
+        # ✅ CRITICAL: Field is 'day_of_week' not 'day'!
+        return sorted({session.day_of_week for session in recurring_sessions})
+
+
+class CachedFieldsMixin:
+    """
+    Mixin to build a serializer's fields ONCE per class instead of per instance.
+    
+    ✅ USE THIS on serializers instantiated once PER ROW (activities view)!
+    
+    DRF deep-copies every declared field (and rebuilds ModelSerializer
+    fields from Meta) each time a serializer is created. Here the built
+    fields are cached per class and only copied per instance:
+    - Plain fields → shallow copy (bind() sets parent/source on the copy)
+    - Nested serializers → deepcopy (they carry their own bound children
+      and MUST NOT be shared between requests!)
+    
+    Put it BEFORE serializers.ModelSerializer / serializers.Serializer in the
+    bases. Subclasses can still adjust the returned dict in get_fields()
+    (a fresh dict per instance - pops never reach the cache, see tests).
+    
+    Used by:
+    - NextOccurrenceSerializer
+    - LeagueSerializer / LeagueDetailSerializer
+    - LeagueActivitySerializer
+    """
+    _fields_cache = {}
+    
+    def get_fields(self):
+        cls = self.__class__
+        cached = CachedFieldsMixin._fields_cache.get(cls)
+        if cached is None:
+            cached = super().get_fields()
+            CachedFieldsMixin._fields_cache[cls] = cached
+        
+        return {
+            name: copy.deepcopy(field) if isinstance(field, serializers.BaseSerializer) else copy.copy(field)
+            for name, field in cached.items()
+        }
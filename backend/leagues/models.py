@@ -1,6 +1,8 @@
 # leagues/models.py
 
 from django.db import models
+from django.db.models import Count, Exists, F, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.core.exceptions import ValidationError
 from functools import cached_property
 from clubs.models import Club, ClubMembership, ClubMembershipSkillLevel
@@ -24,6 +26,157 @@ def get_default_end_date():
     """Default to 12 weeks from start."""
     return get_default_start_date() + timedelta(weeks=12)
 
+class LeagueQuerySet(models.QuerySet):
+    """
+    Reusable League annotations.
+
+    ✅ USE THIS instead of re-declaring the same annotate() in every ViewSet!
+    """
+    def with_counts(self):
+        """
+        Annotate league_participants_count (ACTIVE LeagueParticipations).
+
+        WHY: Serializers read obj.league_participants_count directly.
+        Every queryset that feeds LeagueSerializer / AdminLeagueListSerializer
+        MUST go through this - the COUNT is computed in the same SELECT!
+        ⚡ Correlated subquery (not a JOIN + GROUP BY + DISTINCT) - no row
+        fan-out when combined with other aggregates (earliest_session_date)
+        """
+        active = LeagueParticipation.objects.filter(
+            league=OuterRef('pk'),
+            status=LeagueParticipationStatus.ACTIVE
+        ).order_by().values('league').annotate(
+            total=Count('pk')
+        ).values('total')
+
+        return self.annotate(
+            league_participants_count=Coalesce(Subquery(active), 0)
+        )
+
+    def with_skill_level(self):
+        """
+        Annotate min_skill_level (minimum_skill_level.level, or None).
+
+        WHY: LeagueSerializer only needs the level VALUE - one column in the
+        main query instead of select_related('minimum_skill_level')!
+        """
+        return self.annotate(min_skill_level=F('minimum_skill_level__level'))
+
+    def with_earliest_session_date(self, today=None):
+        """
+        Annotate earliest_session_date (next upcoming, non-cancelled occurrence).
+
+        WHY: Lists order by it - "when's the next session?"
+        ⚡ Correlated subquery (ORDER BY session_date LIMIT 1) - walks the
+        (league, session_date, is_cancelled) index instead of JOINing every
+        occurrence + GROUP BY over all league rows!
+        """
+        if today is None:
+            today = timezone.localdate()
+        next_date = SessionOccurrence.objects.filter(
+            league=OuterRef('pk'),
+            session_date__gte=today,
+            is_cancelled=False
+        ).order_by('session_date').values('session_date')[:1]
+
+        return self.annotate(earliest_session_date=Subquery(next_date))
+
+    def with_recurring_sessions(self):
+        """
+        Prefetch RECURRING sessions into league._recurring_sessions.
+
+        WHY: recurring_days / is_recurring are needed for every league in a
+        list - ONE prefetch query instead of one DISTINCT query per league!
+        """
+        return self.prefetch_related(
+            Prefetch(
+                'sessions',
+                queryset=LeagueSession.objects.exclude(
+                    recurrence_type=RecurrenceType.ONCE
+                ).only('id', 'league', 'day_of_week'),
+                to_attr='_recurring_sessions'
+            )
+        )
+
+    def with_next_occurrence(self):
+        """
+        Prefetch each league's NEXT upcoming occurrence into
+        league._next_occurrences (list with 0 or 1 item).
+
+        WHY: next_session + participants_count need it for every event in a
+        list - ONE prefetch query instead of one query per league!
+        League.next_occurrence reads it when present.
+        """
+        today = timezone.localdate()
+        upcoming = SessionOccurrence.objects.filter(
+            session_date__gte=today,
+            is_cancelled=False
+        )
+        next_per_league = upcoming.filter(
+            league=OuterRef('league')
+        ).order_by('session_date', 'start_datetime').values('pk')[:1]
+
+        return self.prefetch_related(
+            Prefetch(
+                'all_occurrences',
+                queryset=upcoming.filter(
+                    pk=Subquery(next_per_league)
+                ).for_serializer(),
+                to_attr='_next_occurrences'
+            )
+        )
+
+    def with_one_time_session(self):
+        """
+        Prefetch the FIRST occurrence of each one-time league/event (no
+        recurring sessions) into league._one_time_sessions (0 or 1 item).
+
+        WHY: one_time_session_info is needed for every one-time event in a
+        list - ONE prefetch query instead of one query per event!
+        League.one_time_session reads it when present.
+        """
+        first_per_league = SessionOccurrence.objects.filter(
+            league=OuterRef('league')
+        ).order_by('session_date', 'start_datetime').values('pk')[:1]
+        has_recurring = LeagueSession.objects.filter(
+            league=OuterRef('league')
+        ).exclude(recurrence_type=RecurrenceType.ONCE)
+
+        return self.prefetch_related(
+            Prefetch(
+                'all_occurrences',
+                queryset=SessionOccurrence.objects.filter(
+                    pk=Subquery(first_per_league)
+                ).exclude(Exists(has_recurring)).for_serializer(),
+                to_attr='_one_time_sessions'
+            )
+        )
+
+    def with_upcoming_occurrences(self, limit=10):
+        """
+        Prefetch the next `limit` upcoming occurrences of each league into
+        league.upcoming_occurrences_list (sliced per league - Django 4.2+).
+
+        WHY: Detail page shows upcoming_sessions AND next_session - both are
+        served from this ONE prefetch (next_occurrence = first item)!
+        """
+        today = timezone.localdate()
+
+        return self.prefetch_related(
+            Prefetch(
+                'all_occurrences',
+                queryset=SessionOccurrence.objects.filter(
+                    session_date__gte=today,
+                    is_cancelled=False
+                ).for_serializer().order_by('session_date', 'start_datetime')[:limit],
+                to_attr='upcoming_occurrences_list'
+            )
+        )
+
+class LeagueManager(models.Manager.from_queryset(LeagueQuerySet)):
+    """Default League manager: League.objects.with_counts()"""
+    pass
+
 # League model
 class League(models.Model):
 
@@ -166,8 +319,19 @@ class League(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = LeagueManager()
+
     class Meta:
         ordering = ['-start_date', 'name']
+        indexes = [
+            # ⚡ Partial index: active leagues in default ordering - the
+            # is_active=True filter most list queries apply
+            models.Index(
+                fields=['-start_date', 'name'],
+                condition=Q(is_active=True),
+                name='league_active_start_idx'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.club.name})"
@@ -192,8 +356,8 @@ class League(models.Model):
         # So we can't check on initial creation!
         if self.pk:
             # Check if at least one session exists
-            session_count = self.sessions.count()
-            if session_count == 0:
+            # ⚡ EXISTS stops at the first row - no COUNT(*) needed
+            if not self.sessions.exists():
                 raise ValidationError(
                     "At least one session is required! "
                     "Every league/event must have a schedule."
@@ -207,6 +371,15 @@ class League(models.Model):
         For LEAGUES: Check date-based windows
         For EVENTS: Handled per-session in SessionOccurrence
         """
+        return self.registration_open_at(timezone.localtime())
+    
+    def registration_open_at(self, now):
+        """
+        registration_open for a given (timezone-aware) moment.
+        
+        ⚡ Lets serializers pass ONE request-scoped timezone.localtime()
+        instead of converting the clock again for every row!
+        """
         # For events, registration is session-specific
         # Use SessionOccurrence.registration_open instead!
         if self.is_event:
@@ -214,7 +387,7 @@ class League(models.Model):
             return True
         
         # For leagues, check date-based windows
-        now = timezone.localtime().date()
+        now = now.date()
         
         # Check start date
         if self.registration_start_date and now < self.registration_start_date:
@@ -226,23 +399,29 @@ class League(models.Model):
         
         return True  # Default: open
     
-    @property
+    @cached_property
     def next_occurrence(self):
         """
         Get next upcoming SessionOccurrence.
         
         ⚡ OPTIMIZED with direct league FK - NO joins needed!
-        Query is so fast (~5-10ms using indexed league_id) that caching is unnecessary!
+        ⚡ CACHED per instance: LeagueSerializer reads it for next_session AND
+        participants_count - only ONE query per league!
+        ⚡ Lists: prefetched by LeagueQuerySet.with_next_occurrence() - NO query!
         """
-        today = timezone.localtime().date()
+        if hasattr(self, '_next_occurrences'):
+            return self._next_occurrences[0] if self._next_occurrences else None
+        # ⚡ Detail: first of the prefetched upcoming occurrences
+        if hasattr(self, 'upcoming_occurrences_list'):
+            return self.upcoming_occurrences_list[0] if self.upcoming_occurrences_list else None
+        
+        today = timezone.localdate()
         
         return SessionOccurrence.objects.filter(
             league=self,  # ⚡ Direct FK instead of league_session__league!
             session_date__gte=today,
             is_cancelled=False
-        ).select_related(
-            'league_session__court_location__address'
-        ).order_by('session_date', 'start_datetime').first()
+        ).for_serializer().order_by('session_date', 'start_datetime').first()
     
     def get_display_occurrence(self, status='upcoming'):
         """
@@ -256,7 +435,7 @@ class League(models.Model):
         Returns:
             SessionOccurrence or None
         """
-        today = timezone.localtime().date()
+        today = timezone.localdate()
         base_query = SessionOccurrence.objects.filter(
             league=self,
             is_cancelled=False
@@ -410,9 +589,7 @@ class League(models.Model):
                         return (False, None, "Session is full and not accepting waitlist")
             else:
                 # Leagues: Check total enrollment capacity
-                current_count = self.participants.filter(
-                    leagueparticipation__status=LeagueParticipationStatus.ACTIVE
-                ).count()
+                current_count = self.get_current_participants_count()
                 
                 if current_count >= self.max_participants:
                     # League full - can join as reserve?
@@ -453,8 +630,17 @@ class League(models.Model):
             ).count()
         else:
             # Count enrolled members
-            return self.participants.filter(
-                leagueparticipation__status=LeagueParticipationStatus.ACTIVE
+            # ⚡ Annotated (with_counts) or prefetched → NO extra query!
+            if hasattr(self, 'league_participants_count'):
+                return self.league_participants_count
+            if 'league_participants' in getattr(self, '_prefetched_objects_cache', {}):
+                return sum(
+                    1 for participation in self.league_participants.all()
+                    if participation.status == LeagueParticipationStatus.ACTIVE
+                )
+            # ⚡ COUNT on LeagueParticipation only - no User JOIN
+            return self.league_participants.filter(
+                status=LeagueParticipationStatus.ACTIVE
             ).count()
 
     def is_full(self, session_date=None):
@@ -487,12 +673,16 @@ class League(models.Model):
     @property
     def upcoming_occurrences(self):
         """Get next 10 upcoming SessionOccurrences"""
-        today = timezone.localtime().date()
+        # ⚡ Use prefetched occurrences if available (LeagueQuerySet.with_upcoming_occurrences)
+        if hasattr(self, 'upcoming_occurrences_list'):
+            return self.upcoming_occurrences_list
+        
+        today = timezone.localdate()
         return SessionOccurrence.objects.filter(
             league=self,
             session_date__gte=today,
             is_cancelled=False
-        ).order_by('session_date', 'start_datetime')[:10]  # ← Limit to 10!
+        ).for_serializer().order_by('session_date', 'start_datetime')[:10]  # ← Limit to 10!
     
     @property
     def is_recurring(self) -> bool:
@@ -503,7 +693,9 @@ class League(models.Model):
             True if any sessions have recurrence_type != ONCE
             False if all sessions are one-time only
         """
-        from public.constants import RecurrenceType
+        # ⚡ Use prefetched sessions if available (LeagueQuerySet.with_recurring_sessions)
+        if hasattr(self, '_recurring_sessions'):
+            return bool(self._recurring_sessions)
         return self.sessions.exclude(recurrence_type=RecurrenceType.ONCE).exists()
     
     @property
@@ -514,17 +706,17 @@ class League(models.Model):
         
         ⚡ OPTIMIZED with direct league FK - NO joins needed!
         Query is so fast (~5-10ms using indexed league_id) that caching is unnecessary!
+        ⚡ Lists: prefetched by LeagueQuerySet.with_one_time_session() - NO query!
         """
-        today = timezone.localtime().date()
-        
         if self.is_recurring:
             return None
         
+        if hasattr(self, '_one_time_sessions'):
+            return self._one_time_sessions[0] if self._one_time_sessions else None
+        
         return SessionOccurrence.objects.filter(
             league=self,  # ⚡ Direct FK instead of league_session__league!
-        ).select_related(
-            'league_session__court_location__address'
-        ).order_by('session_date', 'start_datetime').first()
+        ).for_serializer().order_by('session_date', 'start_datetime').first()
     
 # Through-table for Member and League (LeagueParticipation)
 class LeagueParticipation(models.Model):
@@ -590,6 +782,12 @@ class LeagueParticipation(models.Model):
     # A single club member can only participate in a league once.
         unique_together = ('club_membership', 'league')
         ordering = ['league', 'member']
+        indexes = [
+            # ⚡ Active participant counts per league (with_counts() subquery)
+            models.Index(fields=['league', 'status'], name='lp_league_status_idx'),
+            # ⚡ "Is this user in this league?" (user_is_participant EXISTS)
+            models.Index(fields=['member', 'league', 'status'], name='lp_member_league_status_idx'),
+        ]
         # NOTE: Constraint removed - validation handled by clean() method instead
         # (Django constraints don't support joined field lookups like 'club_membership__member')
         
@@ -856,6 +1054,64 @@ class LeagueSession(models.Model):
             'recurrence': self.get_recurrence_type_display()
         }
     
+class SessionOccurrenceQuerySet(models.QuerySet):
+    """Reusable SessionOccurrence annotations."""
+    def with_attending_count(self):
+        """
+        Annotate attending_count (ATTENDING LeagueAttendances).
+
+        WHY: NextOccurrenceSerializer.participants_count reads it directly -
+        no COUNT query per occurrence!
+        ⚡ Correlated subquery (not a JOIN) so it stays correct even when the
+        queryset already filters/joins on attendances (e.g. activities view).
+        """
+        attending = LeagueAttendance.objects.filter(
+            session_occurrence=OuterRef('pk'),
+            status=LeagueAttendanceStatus.ATTENDING
+        ).order_by().values('session_occurrence').annotate(
+            total=Count('pk')
+        ).values('total')
+
+        return self.annotate(
+            attending_count=Coalesce(Subquery(attending), 0)
+        )
+
+    # ⚡ Exactly the columns NextOccurrenceSerializer reads (incl. the
+    # select_related rows - the League row alone is ~30 columns!)
+    # Keep in sync with NextOccurrenceSerializer.to_representation()!
+    SERIALIZER_FIELDS = (
+        'id', 'league', 'session_date', 'start_datetime',
+        'registration_opens_at', 'registration_closes_at',
+        'league_session__start_time', 'league_session__end_time',
+        # court_info (address = ALL columns - AddressSerializer uses '__all__')
+        'league_session__court_location__id', 'league_session__court_location__name',
+        'league_session__court_location__address',
+        # max_participants + registration_open
+        'league_session__league__max_participants', 'league_session__league__is_event',
+        'league_session__league__registration_start_date',
+        'league_session__league__registration_end_date',
+        'league_session__league__registration_opens_hours_before',
+        'league_session__league__registration_closes_hours_before',
+    )
+
+    def for_serializer(self):
+        """
+        Everything NextOccurrenceSerializer reads, in ONE query.
+
+        - court_info → league_session.court_location.address
+        - max_participants / registration_open → league_session.league
+        - participants_count → attending_count
+        - ⚡ ONLY those columns (SERIALIZER_FIELDS)
+        """
+        return self.select_related(
+            'league_session__court_location__address',
+            'league_session__league'
+        ).only(*self.SERIALIZER_FIELDS).with_attending_count()
+
+class SessionOccurrenceManager(models.Manager.from_queryset(SessionOccurrenceQuerySet)):
+    """Default SessionOccurrence manager: SessionOccurrence.objects.with_attending_count()"""
+    pass
+
 class SessionOccurrence(models.Model):
     """
     Pre-calculated occurrence of a recurring session.
@@ -925,6 +1181,8 @@ class SessionOccurrence(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = SessionOccurrenceManager()
+    
     class Meta:
         unique_together = ('league_session', 'session_date')
         ordering = ['session_date', 'league_session']
@@ -946,9 +1204,18 @@ class SessionOccurrence(models.Model):
     @property
     def registration_open(self):
         """Check if registration is currently open for this session."""
+        return self.registration_open_at(timezone.localtime())
+    
+    def registration_open_at(self, now):
+        """
+        registration_open for a given (timezone-aware) moment.
+        
+        ⚡ NextOccurrenceSerializer passes ONE request-scoped now for every
+        occurrence instead of calling timezone.localtime() per row!
+        """
         # For leagues: use league-level setting
         if not self.league_session.league.is_event:
-            return self.league_session.league.registration_open
+            return self.league_session.league.registration_open_at(now)
         
         # For events: check session-specific windows
         if not self.registration_opens_at or not self.registration_closes_at:
@@ -956,9 +1223,7 @@ class SessionOccurrence(models.Model):
             league = self.league_session.league
             registration_opens = self.start_datetime - timedelta(hours=league.registration_opens_hours_before)
             registration_closes = self.start_datetime - timedelta(hours=league.registration_closes_hours_before)
-            now = timezone.localtime()
             return registration_opens <= now <= registration_closes
-        now = timezone.localtime()
         return self.registration_opens_at <= now <= self.registration_closes_at
             
     @property
@@ -1307,6 +1572,12 @@ class LeagueAttendance(models.Model):
     class Meta:
         unique_together = ('league_participation', 'session_occurrence')
         ordering = ['session_occurrence', 'league_participation']
+        # ⚡ (league_participation, session_occurrence) is already covered
+        # by the unique_together index above - no need for a second one!
+        indexes = [
+            # ⚡ Attending counts per occurrence (COUNT ... WHERE status=...)
+            models.Index(fields=['session_occurrence', 'status'], name='la_occ_status_idx'),
+        ]
     
     def __str__(self):
         return (
@@ -1552,8 +1823,9 @@ class RoundRobinPattern(models.Model):
 # ========================================
 # SIGNALS
 # ========================================
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from public.pagination import invalidate_cached_counts
 
 @receiver(post_save, sender=LeagueParticipation)
 def create_attendance_records_on_enrollment(sender, instance, created, **kwargs):
@@ -1626,7 +1898,7 @@ def create_attendance_records_on_enrollment(sender, instance, created, **kwargs)
     # (Don't create attendance for past sessions!)
    
     from django.utils import timezone
-    today = timezone.localtime().date()
+    today = timezone.localdate()
     
     future_occurrences = SessionOccurrence.objects.filter(
         league_session__league=league,
@@ -1651,3 +1923,20 @@ def create_attendance_records_on_enrollment(sender, instance, created, **kwargs)
             ignore_conflicts=True  # In case records already exist
         )
     '''
+
+
+@receiver(post_save, sender=League)
+@receiver(post_delete, sender=League)
+@receiver(post_save, sender=LeagueSession)
+@receiver(post_delete, sender=LeagueSession)
+@receiver(post_save, sender=SessionOccurrence)
+@receiver(post_delete, sender=SessionOccurrence)
+def invalidate_league_list_counts(sender, **kwargs):
+    """
+    League list COUNT(*) is cached while paging (LeagueViewSet →
+    CachedCountPagination) - drop it when a league or its sessions change
+    
+    WHY sessions too: type/status filters count leagues by their
+    (upcoming) SessionOccurrences
+    """
+    invalidate_cached_counts()
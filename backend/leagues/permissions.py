@@ -65,24 +65,29 @@ class IsLeagueAdmin(permissions.BasePermission):
         
         return True
     
+    def has_object_permission(self, request, view, obj):
         """
         Check if user has ADMIN, ORGANIZER, or CAPTAIN role in THIS event's club.
-        obj is a League instance.
+        obj is a League (AdminEventsViewSet) or a LeagueParticipation
+        (AdminLeagueParticipantsViewSet) - resolved to its league first.
         """
         # Superusers can do anything
         if request.user.is_superuser:
             return True
         
+        # ✅ LeagueParticipation has no club - go through its league
+        club = getattr(obj, 'league', obj).club
+        
         # Check if user is a member of THIS club
         try:
             membership = ClubMembership.objects.get(
                 member=request.user,
-                club=obj.club,
+                club=club,
                 status=MembershipStatus.ACTIVE
             )
         except ClubMembership.DoesNotExist:
             raise PermissionDenied(
-                detail=f'You are not a member of {obj.club.name}.'
+                detail=f'You are not a member of {club.name}.'
             )
         
         # Check if they have one of the required roles
@@ -92,7 +97,33 @@ class IsLeagueAdmin(permissions.BasePermission):
         
         if not has_admin_role:
             raise PermissionDenied(
-                detail=f'You must have Admin, Organizer, or Captain role in {obj.club.name} to access this event.'
+                detail=f'You must have Admin, Organizer, or Captain role in {club.name} to access this event.'
+            )
+        
+        return True
+    
+    def has_leagues_permission(self, request, leagues):
+        """
+        Bulk version of has_object_permission for MANY leagues (bulk actions).
+        
+        ⚡ ONE query for all the leagues' clubs - instead of two queries
+        (membership + roles) per league!
+        """
+        # Superusers can do anything
+        if request.user.is_superuser:
+            return True
+        
+        club_ids = {league.club_id for league in leagues}
+        admin_club_ids = set(ClubMembership.objects.filter(
+            member=request.user,
+            club_id__in=club_ids,
+            status=MembershipStatus.ACTIVE,
+            roles__name__in=[RoleType.ADMIN, RoleType.ORGANIZER, RoleType.CAPTAIN]
+        ).values_list('club_id', flat=True))
+        
+        if club_ids - admin_club_ids:
+            raise PermissionDenied(
+                detail='You must have Admin, Organizer, or Captain role in every club of these events.'
             )
         
-        return True
\ No newline at end of file
+        return True
@@ -1,14 +1,17 @@
 
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+from django.utils.functional import cached_property
 
 from users.serializers import UserInfoSerializer
 from .models import League, LeagueParticipation, LeagueAttendance, LeagueSession
 from public.constants import LeagueAttendanceStatus, LeagueParticipationStatus
-from django.utils import timezone
-from .mixins import CaptainInfoMixin
+from .mixins import CaptainInfoMixin, RecurringDaysMixin, CachedFieldsMixin
 from courts.serializers import CourtLocationInfoSerializer
-from clubs.serializers import ClubInfoSerializer
+from clubs.models import Club
+from clubs.serializers import ClubInfoSerializer, AdminClubMembershipSerializer
 
 # Get the active user model
 User = get_user_model()
@@ -31,10 +34,9 @@ class LeagueSessionSerializer(serializers.ModelSerializer):
                   ] 
     def get_court_location_info(self, obj):
         """Return minimal court Location using CourtLocationInfoSerializer"""
-        from courts.serializers import CourtLocationInfoSerializer
         return CourtLocationInfoSerializer(obj.court_location).data
    
-class NextOccurrenceSerializer(serializers.Serializer):
+class NextOccurrenceSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Next occurrence data for EventCard.
     
@@ -42,6 +44,10 @@ class NextOccurrenceSerializer(serializers.Serializer):
     - Added id field (SessionOccurrence.id)
     - Added participants_count (ATTENDING users for THIS occurrence)
     - Added user_attendance_status (user's status for THIS occurrence)
+    
+    UPDATED 2026-10-17:
+    - ⚡ Manual to_representation() (hot path: every card + upcoming_sessions)
+    - Field declarations below still DOCUMENT the output shape!
     """
     # SessionOccurrence ID (needed for API calls)
     id = serializers.IntegerField()
@@ -63,12 +69,62 @@ class NextOccurrenceSerializer(serializers.Serializer):
     registration_open = serializers.BooleanField()
     max_participants = serializers.IntegerField(source='league_session.league.max_participants')
 
+    def to_representation(self, instance):
+        """
+        Build the dict directly - skips DRF's per-field get_attribute()
+        traversal of the dotted sources for every occurrence.
+        
+        ⚠️ Output MUST match the declared fields (ISO dates/times, None-safe)!
+        Expects SessionOccurrence.objects.for_serializer() (no extra queries).
+        """
+        league_session = instance.league_session
+        start_time = league_session.start_time
+        end_time = league_session.end_time
+        
+        return {
+            'id': instance.id,
+            'date': instance.session_date.isoformat(),
+            'start_time': start_time.isoformat() if start_time else None,
+            'end_time': end_time.isoformat() if end_time else None,
+            'court_info': self.get_court_info(league_session),
+            'participants_count': self.get_participants_count(instance),
+            'user_attendance_status': self.get_user_attendance_status(instance),
+            'registration_open': instance.registration_open_at(self._now),
+            'max_participants': league_session.league.max_participants,
+        }
+    
+    @cached_property
+    def _now(self):
+        """ONE timezone.localtime() per serializer (shared by every occurrence)"""
+        return timezone.localtime()
+    
+    def get_court_info(self, league_session) -> dict:
+        """
+        Court location (+ address) of the occurrence's session.
+        
+        ⚡ Memoized per request in context['_court_info_cache'] (keyed by
+        court_location_id): every occurrence at the same court shares ONE
+        dict - the nested serializer runs once per court, not per row!
+        """
+        court_info_cache = self.context.setdefault('_court_info_cache', {})
+        court_info = court_info_cache.get(league_session.court_location_id)
+        if court_info is None:
+            # ✅ Reuses the bound nested serializer - no new serializer per row!
+            court_info = self.fields['court_info'].to_representation(league_session.court_location)
+            court_info_cache[league_session.court_location_id] = court_info
+        return court_info
+    
     def get_participants_count(self, obj) -> int:
-        """Count ATTENDING users for THIS occurrence"""
-        return LeagueAttendance.objects.filter(
-            session_occurrence=obj,
-            status=LeagueAttendanceStatus.ATTENDING
-        ).count()
+        """
+        Count ATTENDING users for THIS occurrence.
+        
+        ⚡ Annotated by SessionOccurrence.objects.with_attending_count()
+        (unannotated occurrences - e.g. reached through a FK - fall back to a query)
+        """
+        attending_count = getattr(obj, 'attending_count', None)
+        if attending_count is None:
+            return obj.current_participants_count
+        return attending_count
     
     def get_user_attendance_status(self, obj) -> str | None:
         """
@@ -85,24 +141,27 @@ class NextOccurrenceSerializer(serializers.Serializer):
         if 'user_attendance_status' in self.context:
             return self.context['user_attendance_status']  # ← Use it!
         
-        # Context 2: Other views pass 'request' (calculate from DB)
+        # Context 2: LeagueViewSet passes the attendance for the occurrences it
+        # serializes (one query!) - None = no record for a covered occurrence
+        # Occurrences the map doesn't cover fall through to the query below
+        user_att_by_occ = self.context.get('user_att_by_occ')
+        if user_att_by_occ is not None and obj.id in user_att_by_occ:
+            return user_att_by_occ[obj.id]
+        
+        # Context 3: Other views pass 'request' (calculate from DB)
         # ✅ FALLBACK: Compute it (for other endpoints that don't pass via context)
         # This is the ORIGINAL logic for backwards compatibility!
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
             return None
         
-        try:
-            attendance = LeagueAttendance.objects.get(
-                session_occurrence=obj,
-                league_participation__member=request.user
-            )
-            return attendance.status
-            
-        except LeagueAttendance.DoesNotExist:
-            return None
+        # ⚡ Only fetch the status column (None if no attendance record)
+        return LeagueAttendance.objects.filter(
+            session_occurrence=obj,
+            league_participation__member=request.user
+        ).values_list('status', flat=True).first()
     
-class LeagueSerializer(CaptainInfoMixin, serializers.ModelSerializer):
+class LeagueSerializer(CaptainInfoMixin, RecurringDaysMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Lightweight serializer for league/event list.
     
@@ -119,15 +178,17 @@ class LeagueSerializer(CaptainInfoMixin, serializers.ModelSerializer):
       * Leagues: Total LeagueParticipation count
       * Events: LeagueAttendance count for next occurrence
     """
-    # club_info = serializers.SerializerMethodField()
-    club_info = ClubInfoSerializer(source='club')
-   
-    captain_info = serializers.SerializerMethodField()
+    # ⚡ club_info + captain_info are built as plain dicts in to_representation()
+    # (no nested serializer / method field bound per row!)
+    # ✅ club: write-only FK for create/update - club_info is output only
+    # (missing / unknown club → 400, not an IntegrityError on club_id)
+    club = serializers.PrimaryKeyRelatedField(queryset=Club.objects.all(), write_only=True)
+    # ⚡ Reads the min_skill_level annotation (LeagueQuerySet.with_skill_level)
+    # - no JOIN'd ClubMembershipSkillLevel row / dotted source walk per league!
+    # Not annotated (freshly created league - read-only, so never set) → None
     minimum_skill_level = serializers.IntegerField(
-                  source='minimum_skill_level.level',
-                  allow_null=True,
-                  read_only=True
-            )
+        source='min_skill_level', allow_null=True, read_only=True
+    )
     # Next occurrence (computed)
     next_session = serializers.SerializerMethodField()
     one_time_session_info = serializers.SerializerMethodField()
@@ -135,11 +196,14 @@ class LeagueSerializer(CaptainInfoMixin, serializers.ModelSerializer):
     # Participant count (smart counting!)
     participants_count = serializers.SerializerMethodField()
     
-    # ✅ User participation fields (read from annotations!)
-    # These are annotated in LeagueViewSet.get_queryset() when include_user_participation=true
-    user_is_captain = serializers.BooleanField(read_only=True, required=False)
+    # ✅ User participation fields (only when include_user_participation=true)
+    # ⚡ user_is_captain compares the loaded captain_id - no SQL needed
+    user_is_captain = serializers.SerializerMethodField()
+    # user_is_participant is annotated in LeagueViewSet.get_queryset() (EXISTS)
     user_is_participant = serializers.BooleanField(read_only=True, required=False)
-    user_has_upcoming_sessions = serializers.SerializerMethodField()
+    # ⚡ Annotated in LeagueViewSet.get_queryset() (EXISTS) - False when not annotated
+    user_has_upcoming_sessions = serializers.BooleanField(read_only=True, default=False)
+    # ✅ recurring_days comes from RecurringDaysMixin!
     recurring_days = serializers.SerializerMethodField()
     # upcoming_sessions = serializers.SerializerMethodField()
 
@@ -150,8 +214,7 @@ class LeagueSerializer(CaptainInfoMixin, serializers.ModelSerializer):
             'name',
             'description',
             'is_event',
-            'club_info',  
-            'captain_info',
+            'club',
             'minimum_skill_level',
             'next_session',
             'one_time_session_info',
@@ -179,6 +242,46 @@ class LeagueSerializer(CaptainInfoMixin, serializers.ModelSerializer):
     #     from clubs.serializers import ClubInfoSerializer
     #     return ClubInfoSerializer(obj.club).data
     
+    @classmethod
+    def get_optimized_queryset(cls, queryset, include_counts=True):
+        """
+        Apply every select_related / annotation / prefetch this serializer reads.
+        
+        ✅ USE THIS on any League queryset fed to LeagueSerializer!
+        (Most of them feed SerializerMethodFields / to_representation)
+        
+        - captain + club → captain_info / club_info (to_representation)
+        - with_skill_level() → minimum_skill_level
+        - with_counts() → participants_count (leagues) - skipped when
+          include_counts=False (field is dropped too, see get_fields)
+        - with_recurring_sessions() → recurring_days / is_recurring
+        - prefetch_occurrences() → next_session / one_time_session_info
+        """
+        queryset = queryset.select_related('captain', 'club').with_skill_level()
+        if include_counts:
+            queryset = queryset.with_counts()
+        queryset = queryset.with_recurring_sessions()
+        return cls.prefetch_occurrences(queryset)
+    
+    @classmethod
+    def prefetch_occurrences(cls, queryset):
+        """
+        List: ONLY the next occurrence (+ first one of one-time events)
+        → 2 queries total instead of 1-2 per league!
+        """
+        return queryset.with_next_occurrence().with_one_time_session()
+    
+    @cached_property
+    def _next_occurrence_serializer(self):
+        """
+        ONE NextOccurrenceSerializer per LeagueSerializer (= per request with many=True).
+        
+        ⚡ Reused for every row instead of building (and binding) a new
+        serializer per league in get_next_session / get_one_time_session_info!
+        """
+        # ⚡ CRITICAL: Pass request context for user_attendance_status!
+        return NextOccurrenceSerializer(context=self.context)
+    
     def get_next_session(self, obj):
         """
         Uses League.next_occurrence @property directly!
@@ -188,8 +291,7 @@ class LeagueSerializer(CaptainInfoMixin, serializers.ModelSerializer):
         next_occ = obj.next_occurrence
         
         if next_occ:
-            # ⚡ CRITICAL: Pass request context for user_attendance_status!
-            return NextOccurrenceSerializer(next_occ, context=self.context).data
+            return self._next_occurrence_serializer.to_representation(next_occ)
         
         return None
     
@@ -200,7 +302,7 @@ class LeagueSerializer(CaptainInfoMixin, serializers.ModelSerializer):
         """
         one_time_session_info = obj.one_time_session
         if one_time_session_info:
-            return NextOccurrenceSerializer(one_time_session_info, context=self.context).data
+            return self._next_occurrence_serializer.to_representation(one_time_session_info)
         return None
     
     def get_participants_count(self, obj):
@@ -210,87 +312,81 @@ class LeagueSerializer(CaptainInfoMixin, serializers.ModelSerializer):
         - Events: Attendance for NEXT occurrence (LeagueAttendance)
         """
         if not obj.is_event:
-            # LEAGUES: Use annotated count from ViewSet
-            if hasattr(obj, 'league_participants_count'):
-                return obj.league_participants_count
-            return 0
+            # LEAGUES: Annotated by League.objects.with_counts()
+            # (unannotated leagues - e.g. create responses - fall back to a query)
+            return obj.get_current_participants_count()
         
         # EVENTS: Count attendance for NEXT occurrence
-        # ⚡ Use the property - it's already calculated!
+        # ⚡ Prefetched (with_next_occurrence) or cached - NO extra query!
         next_occ = obj.next_occurrence  # ← Property call!
         
         if not next_occ:
             return 0
         
-        # Count attending participants for this occurrence
-        return LeagueAttendance.objects.filter(
-            session_occurrence=next_occ,
-            status=LeagueAttendanceStatus.ATTENDING
-        ).count()
+        # ⚡ Annotated on the occurrence - no extra COUNT query!
+        # (unannotated occurrences fall back to a query)
+        attending_count = getattr(next_occ, 'attending_count', None)
+        if attending_count is None:
+            return next_occ.current_participants_count
+        return attending_count
+    
+    @cached_property
+    def _include_participation(self):
+        """include_user_participation flag - read from context ONCE per serializer"""
+        return self.context.get('include_user_participation', False)
+    
+    @cached_property
+    def _include_counts(self):
+        """include_counts flag (default True) - read from context ONCE per serializer"""
+        return self.context.get('include_counts', True)
+    
+    @cached_property
+    def _user_id(self):
+        """Authenticated user's id (None for anonymous / no request)"""
+        request = self.context.get('request')
+        return request.user.id if request else None
     
-    def get_recurring_days(self, obj: League) -> list[int]:
-        from public.constants import RecurrenceType
-        """
-        Get list of days this league/event occurs on.
-        
-        Returns: [0, 2, 4] for Mon, Wed, Fri
-        Uses DayOfWeek constants: MON=0, TUE=1, WED=2, THU=3, FRI=4, SAT=5, SUN=6
-        """
-        # Get days from RECURRING sessions only (exclude one-time sessions)
-        # ✅ CRITICAL: Filter by recurrence_type, NOT session count!
-        recurring_sessions = obj.sessions.exclude(recurrence_type=RecurrenceType.ONCE)
-        
-        # Get unique days from recurring sessions
-        # ✅ CRITICAL: Field is 'day_of_week' not 'day'!
-        days = recurring_sessions.values_list('day_of_week', flat=True).distinct().order_by('day_of_week')
-        return list(days)
+    def get_user_is_captain(self, obj) -> bool:
+        """⚡ captain_id is already on the row - no CASE annotation needed"""
+        return self._user_id is not None and obj.captain_id == self._user_id
     
-    def get_user_has_upcoming_sessions(self, obj: League) -> bool:
+    def get_fields(self):
         """
-        Check if authenticated user is enrolled in ANY upcoming session.
-        
-        Only relevant for recurring events where user might be enrolled in
-        a different session than next_occurrence.
-        
-        For one-time events: Returns False (use next_occurrence.user_attendance_status)
-        For recurring events: Returns True if user enrolled in any upcoming session
+        Remove user fields / participants_count if not requested.
         
-        Example:
-            Event has Mon/Wed sessions
-            next_occurrence = Monday (user NOT enrolled)  
-            But user IS enrolled for Wednesday
-            → Returns True to show "Enrolled (other day)" badge
+        ⚡ Built ONCE per serializer (shared by every row with many=True),
+        so the fields are never serialized at all instead of popped per row!
         """
-        request = self.context.get('request')
-        if not request or not request.user.is_authenticated:
-            return False
+        fields = super().get_fields()
         
-        # Only relevant for recurring events
-        if not obj.is_recurring:  # ✅ Uses the new property!
-            return False
+        # Remove user-specific fields if not requested (or anonymous)
+        if not self._include_participation or self._user_id is None:
+            fields.pop('user_is_captain', None)
+            fields.pop('user_is_participant', None)
         
-        # Check if user enrolled in any upcoming session occurrence
-        today = timezone.localtime().date()
+        # Remove participants_count if opted out (include_counts=false)
+        if not self._include_counts:
+            fields.pop('participants_count', None)
         
-        # ✅ CORRECT: Query through LeagueAttendance → SessionOccurrence
-        return LeagueAttendance.objects.filter(
-            league_participation__league=obj,
-            league_participation__member=request.user,
-            session_occurrence__session_date__gte=today,
-            session_occurrence__is_cancelled=False,
-            status=LeagueAttendanceStatus.ATTENDING
-        ).exists()
+        return fields
     
     def to_representation(self, instance):
-        """Remove user fields if not requested"""
-        data = super().to_representation(instance)
-        
-        # Remove user-specific fields if not requested
-        include_participation = self.context.get('include_user_participation', False)
-        if not include_participation:
-            data.pop('user_is_captain', None)
-            data.pop('user_is_participant', None)
+        """
+        Add club_info + captain_info as plain dicts.
         
+        ⚡ club + captain are select_related by LeagueViewSet - NO extra query!
+        Output matches ClubInfoSerializer / UserInfoSerializer exactly.
+        """
+        data = super().to_representation(instance)
+        club = instance.club
+        data['club_info'] = {
+            'id': club.id,
+            'name': club.name,
+            'logo_url': club.logo_url,
+            'club_type': club.club_type,
+            'short_name': club.short_name,
+        }
+        data['captain_info'] = self.get_captain_info(instance)
         return data
 
 class LeagueDetailSerializer(LeagueSerializer):
@@ -300,9 +396,9 @@ class LeagueDetailSerializer(LeagueSerializer):
     
     INHERITS from LeagueSerializer:
     - All base fields (club_info, captain_info, next_session, etc.)
-    - All base methods (get_club_info, get_next_session, get_participants_count, etc.)
+    - All base methods (get_next_session, get_participants_count, etc.)
     - User participation logic (user_is_captain, user_is_participant)
-    - to_representation() override for conditional user fields
+    - get_fields() override for conditional user fields
     
     ADDS:
     - registration_start_date, registration_end_date (for detail view)
@@ -318,7 +414,10 @@ class LeagueDetailSerializer(LeagueSerializer):
     
     # ✅ ONLY declare NEW fields (not in LeagueSerializer)
     upcoming_sessions = serializers.SerializerMethodField()
-    user_next_session_id = serializers.SerializerMethodField()
+    # ⚡ SessionOccurrence.id of user's next ATTENDING session (None = not attending)
+    # Annotated by LeagueViewSet.get_queryset() (Subquery) - highlights WHICH
+    # session the user is attending ("Monday" vs "Wednesday") on the detail page
+    user_next_session_id = serializers.IntegerField(read_only=True, allow_null=True, default=None)
     
     class Meta(LeagueSerializer.Meta):  # ← Inherit Meta from parent!
         # Start with all parent fields, then add new ones
@@ -331,6 +430,14 @@ class LeagueDetailSerializer(LeagueSerializer):
     
     # ✅ ONLY define NEW methods (not in LeagueSerializer)
     
+    @classmethod
+    def prefetch_occurrences(cls, queryset):
+        """
+        Detail: the next 10 upcoming occurrences → upcoming_sessions AND
+        next_session (= first item) from ONE prefetch!
+        """
+        return queryset.with_upcoming_occurrences()
+    
     def get_upcoming_sessions(self, obj):
         """
         Get ALL upcoming sessions for this league/event.
@@ -353,57 +460,17 @@ class LeagueDetailSerializer(LeagueSerializer):
     
         return []
     
-    def get_user_next_session_id(self, obj: League) -> int | None:
-        """
-        Returns the ID of the next session the user is attending.
-        
-        USE CASE:
-        - Detail page needs to know WHICH specific session to highlight
-        - "You're attending the Monday session" vs "You're attending Wednesday"
-        
-        Returns:
-        - int: SessionOccurrence.id of user's next attending session
-        - None: User not attending any upcoming sessions
-        
-        Example:
-            Event has Mon/Wed/Fri sessions
-            User enrolled for Wednesday only
-            → Returns Wednesday's SessionOccurrence.id
-        """
-        request = self.context.get('request')
-        if not request or not request.user.is_authenticated:
-            return None
-        
-        today = timezone.localtime().date()
-      
-        # Get the NEXT session the user is attending (earliest date/time)
-        attendance = LeagueAttendance.objects.filter(
-            league_participation__league=obj,
-            league_participation__member=request.user,
-            session_occurrence__session_date__gte=today,
-            session_occurrence__is_cancelled=False,
-            status=LeagueAttendanceStatus.ATTENDING
-        ).order_by(
-            'session_occurrence__session_date',
-            'session_occurrence__start_datetime'
-        ).first()
-    
-        # Return the session occurrence ID or None
-        return attendance.session_occurrence_id if attendance else None
-    
     # ✅ INHERITED from LeagueSerializer (no need to redefine!):
-    # - get_club_info()
     # - get_captain_info() (from CaptainInfoMixin)
+    # - to_representation() (club_info + captain_info dicts)
     # - get_next_session()
     # - get_one_time_session_info()
     # - get_participants_count()
     # - get_recurring_days()
-    # - get_user_has_upcoming_sessions()
-    # - to_representation() (conditional user fields logic)
+    # - get_fields() (conditional user fields logic)
+    # - get_optimized_queryset() (uses prefetch_occurrences() above)
     
     # All field declarations inherited too:
-    # - club_info
-    # - captain_info
     # - minimum_skill_level
     # - next_session
     # - one_time_session_info
@@ -413,7 +480,7 @@ class LeagueDetailSerializer(LeagueSerializer):
     # - user_is_participant
     # - user_has_upcoming_sessions    
 
-class LeagueActivitySerializer(CaptainInfoMixin, serializers.ModelSerializer):
+class LeagueActivitySerializer(CaptainInfoMixin, RecurringDaysMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Simplified League serializer for activities endpoint.
     
@@ -438,6 +505,7 @@ class LeagueActivitySerializer(CaptainInfoMixin, serializers.ModelSerializer):
     user_is_captain = serializers.SerializerMethodField()
     user_is_participant = serializers.SerializerMethodField()
 
+    # ✅ recurring_days comes from RecurringDaysMixin!
     recurring_days = serializers.SerializerMethodField()
     minimum_skill_level = serializers.IntegerField(
                   source='minimum_skill_level.level',
@@ -475,23 +543,6 @@ class LeagueActivitySerializer(CaptainInfoMixin, serializers.ModelSerializer):
     #     from clubs.serializers import ClubInfoSerializer
     #     return ClubInfoSerializer(obj.club).data
     
-    def get_recurring_days(self, obj: League) -> list[int]:
-        from public.constants import RecurrenceType
-        """
-        Get list of days this league/event occurs on.
-        
-        Returns: [0, 2, 4] for Mon, Wed, Fri
-        Uses DayOfWeek constants: MON=0, TUE=1, WED=2, THU=3, FRI=4, SAT=5, SUN=6
-        """
-        # Get days from RECURRING sessions only (exclude one-time sessions)
-        # ✅ CRITICAL: Filter by recurrence_type, NOT session count!
-        recurring_sessions = obj.sessions.exclude(recurrence_type=RecurrenceType.ONCE)
-        
-        # Get unique days from recurring sessions
-        # ✅ CRITICAL: Field is 'day_of_week' not 'day'!
-        days = recurring_sessions.values_list('day_of_week', flat=True).distinct().order_by('day_of_week')
-        return list(days)
-
 class AdminLeagueListSerializer(CaptainInfoMixin, serializers.ModelSerializer):
     # club_info = serializers.SerializerMethodField()
     club_info = ClubInfoSerializer(source='club')
@@ -505,9 +556,9 @@ class AdminLeagueListSerializer(CaptainInfoMixin, serializers.ModelSerializer):
     # Participant count (smart counting!)
     participants_count = serializers.SerializerMethodField()
     
-    # ✅ User participation fields (read from annotations!)
-    # These are annotated in LeagueViewSet.get_queryset() when include_user_participation=true
-    user_is_captain = serializers.BooleanField(read_only=True, required=False)
+    # ✅ User participation field
+    # ⚡ Compares the loaded captain_id with the admin's id - no SQL needed
+    user_is_captain = serializers.SerializerMethodField()
     
     class Meta:
         model = League
@@ -538,12 +589,16 @@ class AdminLeagueListSerializer(CaptainInfoMixin, serializers.ModelSerializer):
         - Events: Attendance for NEXT occurrence (LeagueAttendance)
         """
         if not obj.is_event:
-            # LEAGUES: Use annotated count from ViewSet
-            if hasattr(obj, 'league_participants_count'):
-                return obj.league_participants_count
-            return 0
+            # LEAGUES: Annotated by League.objects.with_counts()
+            # (unannotated leagues - e.g. create responses - fall back to a query)
+            return obj.get_current_participants_count()
         return 0
     
+    def get_user_is_captain(self, obj) -> bool:
+        """Is the requesting admin this league's captain?"""
+        request = self.context.get('request')
+        return request is not None and obj.captain_id == request.user.id
+    
 class AdminLeagueDetailSerializer(AdminLeagueListSerializer):
     '''
     league = models.ForeignKey(
@@ -599,7 +654,6 @@ class AdminLeagueParticipationSerializer(serializers.ModelSerializer):
     - Updates all other fields normally
     """
     
-    from clubs.serializers import AdminClubMembershipSerializer
     participant = AdminClubMembershipSerializer(source='club_membership', read_only=True)
 
     class Meta:
@@ -667,25 +721,27 @@ class AdminLeagueParticipationSerializer(serializers.ModelSerializer):
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         
-        instance.save()
-        
-        # ========================================
-        # HANDLE STATUS CHANGE (if applicable)
-        # ========================================
-        if status_changed:
-            # Import the existing service
-            from .services.status_change import handle_participation_status_change
+        # ✅ ALL OR NOTHING: save + attendance sync in ONE transaction
+        with transaction.atomic():
+            instance.save()
             
-            # Trigger attendance creation/deletion
-            attendance_changes = handle_participation_status_change(
-                participation=instance,
-                old_status=old_status,
-                new_status=new_status
-            )
-            
-            # Store for to_representation (optional)
-            # This allows you to return attendance info in response
-            instance._attendance_changes = attendance_changes
+            # ========================================
+            # HANDLE STATUS CHANGE (if applicable)
+            # ========================================
+            if status_changed:
+                # Import the existing service
+                from .services.status_change import handle_participation_status_change
+                
+                # Trigger attendance creation/deletion
+                attendance_changes = handle_participation_status_change(
+                    participation=instance,
+                    old_status=old_status,
+                    new_status=new_status
+                )
+                
+                # Store for to_representation (optional)
+                # This allows you to return attendance info in response
+                instance._attendance_changes = attendance_changes
         
         return instance
     
@@ -780,30 +836,33 @@ class BulkLeagueParticipationStatusSerializer(serializers.Serializer):
             instances = [instances]
             
         # Import service here to avoid circular imports
-        from .services.status_change import handle_participation_status_change
+        from .services.status_change import handle_bulk_participation_status_change
         
         updated_instances = []
-        attendance_changes = []
+        changes = []  # (participation, old_status)
         
-        for participation in instances:
-            old_status = participation.status
-            
-            # Only update if status actually changed
-            if old_status != new_status:
-                # Update status
-                participation.status = new_status
-                participation.save()
+        # ✅ ALL OR NOTHING: status saves + attendance sync in ONE transaction
+        # (an attendance error must not leave the statuses half-applied!)
+        with transaction.atomic():
+            for participation in instances:
+                old_status = participation.status
                 
-                # Handle attendance records (create/delete/update based on status change)
-                result = handle_participation_status_change(
-                    participation, old_status, new_status
-                )
-                attendance_changes.append({
-                    'participation_id': participation.id,
-                    **result
-                })
+                # Only update if status actually changed
+                if old_status != new_status:
+                    # Update status
+                    participation.status = new_status
+                    participation.save()
+                    changes.append((participation, old_status))
+                
+                updated_instances.append(participation)
             
-            updated_instances.append(participation)
+            # Handle attendance records (create/delete/update based on status change)
+            # ⚡ Batched per transition type: a few queries total, not per participation
+            results = handle_bulk_participation_status_change(changes, new_status)
+        attendance_changes = [
+            {'participation_id': participation.id, **result}
+            for (participation, old_status), result in zip(changes, results)
+        ]
         
         # Store attendance changes in instance for response
         # (We'll return this via to_representation)
@@ -1,13 +1,62 @@
 """
 Round-Robin Match Generator Service
 
-Generates matches from rotation patterns stored in RoundRobinPattern model.
+Generates matches from rotation patterns stored in RoundRobinPattern model
+(or computed with the circle method when no pattern is stored).
 Maps player positions to actual User objects.
 """
 
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
 from leagues.models import RoundRobinPattern
+from leagues.services.round_robin_algo import circle_method_pattern
 from public.constants import MatchFormat, MatchType, ScoreFormat, MatchStatus
 
+# ⚡ Stored patterns live in Django's cache (shared by ALL workers when the
+# backend is shared) - the TTL bounds staleness for per-process backends
+PATTERN_CACHE_TIMEOUT = 300  # seconds
+PATTERN_CACHE_VERSION_KEY = 'round_robin_pattern:version'
+
+
+def _load_pattern(num_players):
+    """
+    Load a rotation pattern's JSON (cached for PATTERN_CACHE_TIMEOUT).
+    
+    ⚡ Patterns are small, static rows - every generator for the same player
+    count reuses the cached pattern_data instead of a new SELECT!
+    Keys carry a version bumped by clear_pattern_cache() on every edit.
+    (Missing patterns raise DoesNotExist and are NOT cached)
+    """
+    version = cache.get_or_set(PATTERN_CACHE_VERSION_KEY, 1, timeout=None)
+    key = f'round_robin_pattern:{version}:{num_players}'
+    
+    pattern_data = cache.get(key)
+    if pattern_data is None:
+        pattern_data = RoundRobinPattern.objects.only('pattern_data').get(
+            num_players=num_players
+        ).pattern_data
+        cache.set(key, pattern_data, PATTERN_CACHE_TIMEOUT)
+    return pattern_data
+
+
+@receiver(post_save, sender=RoundRobinPattern)
+@receiver(post_delete, sender=RoundRobinPattern)
+def clear_pattern_cache(sender, **kwargs):
+    """
+    Pattern edited in admin → bump the key version (drops EVERY cached pattern)
+    
+    ⚠️ Shared cache backend: every worker sees it at once. Per-process
+    backend (LocMemCache default): other workers within PATTERN_CACHE_TIMEOUT.
+    """
+    try:
+        cache.incr(PATTERN_CACHE_VERSION_KEY)
+    except ValueError:  # Version key missing/evicted → skip past the default 1
+        cache.set(PATTERN_CACHE_VERSION_KEY, 2, timeout=None)
+
+
 class RoundRobinGenerator:
     """
     Generates round-robin matches from rotation patterns.
@@ -24,40 +73,57 @@ class RoundRobinGenerator:
         """
         self.league_session = league_session
         self.session_date = session_date
-        self.attending_players = list(attending_players)
-        self.num_players = len(attending_players)
+        # ⚡ Tuple: read-only, indexed per position in generate_matches()
+        self.attending_players = tuple(attending_players)
+        self.num_players = len(self.attending_players)
         self.num_courts = league_session.courts_used
         
         # Get rotation pattern
         self.pattern = self._get_rotation_pattern()
     
     def _get_rotation_pattern(self):
-        """Get rotation pattern from database."""
+        """
+        Get rotation pattern (cached per player count - see _load_pattern).
+        
+        ✅ Stored (custom) patterns win - e.g. the club's paper sheets
+        ⚡ No stored pattern → circle method fallback (pure Python, cached)
+        """
+        # ✅ Patterns are unique per num_players (courts = num_players // 4)
         try:
-            pattern_obj = RoundRobinPattern.objects.get(
-                num_courts=self.num_courts,
-                num_players=self.num_players
-            )
-            return pattern_obj.pattern_data
+            return _load_pattern(self.num_players)
         except RoundRobinPattern.DoesNotExist:
-            raise ValueError(
-                f"No rotation pattern found for {self.num_courts} courts "
-                f"and {self.num_players} players. Please add pattern to database."
-            )
+            if self.num_players < 4 or self.num_courts < 1:
+                raise ValueError(
+                    f"No rotation pattern found for {self.num_courts} courts "
+                    f"and {self.num_players} players. Please add pattern to database."
+                )
+            return circle_method_pattern(self.num_players, self.num_courts)
     
     def generate_matches(self):
         """
         Generate matches with player assignments.
         
+        ⚡ BULK: Matches, Teams and TeamPlayers are each inserted with ONE
+        bulk_create (3 INSERTs total) instead of 1 + 2 + 4 INSERTs per court
+        per round - all inside one transaction.
+        
         Returns:
             List of Match objects with teams and players assigned
         """
+        from matches.models import Match, Team, TeamPlayer
+        
+        # ⚡ Locals hoisted out of the rounds × courts loops
+        players = self.attending_players
+        num_courts = self.num_courts
+        
+        # PASS 1: Build (unsaved) matches + their team line-ups
         matches = []
+        lineups = []  # (team_name_prefix, team1_players, team2_players)
         
         for round_data in self.pattern['rounds']:
-            round_num = round_data['round_num']
+            round_prefix = f"Round {round_data['round_num']} Court "
             
-            for court_num in range(1, self.num_courts + 1):
+            for court_num in range(1, num_courts + 1):
                 court_key = f'court_{court_num}'
                 
                 if court_key not in round_data:
@@ -68,33 +134,43 @@ class RoundRobinGenerator:
                 
                 # Map positions to actual players
                 # IMPORTANT: Positions are 1-based!
-                team1_players = [
-                    self.attending_players[pos - 1]
-                    for pos in team1_positions
-                ]
-                team2_players = [
-                    self.attending_players[pos - 1]
-                    for pos in team2_positions
-                ]
-                
-                # Create match
-                match = self._create_match(
-                    round_num=round_num,
-                    court_number=court_num,
-                    team1_players=team1_players,
-                    team2_players=team2_players
-                )
+                team1_players = [players[pos - 1] for pos in team1_positions]
+                team2_players = [players[pos - 1] for pos in team2_positions]
                 
-                matches.append(match)
+                matches.append(self._build_match(court_number=court_num))
+                # ⚡ Team name prefix formatted ONCE per match (+ 'A'/'B' below)
+                lineups.append((f"{round_prefix}{court_num}", team1_players, team2_players))
+        
+        with transaction.atomic():
+            # PASS 2: Matches (PKs are set on the objects by bulk_create)
+            Match.objects.bulk_create(matches)
+            
+            # PASS 3: Two teams per match
+            teams = []
+            team_members = []  # players of teams[i]
+            for match, (team_name, team1_players, team2_players) in zip(matches, lineups):
+                for side, players in (('A', team1_players), ('B', team2_players)):
+                    teams.append(Team(
+                        match=match,
+                        team_name=team_name + side
+                    ))
+                    team_members.append(players)
+            Team.objects.bulk_create(teams)
+            
+            # PASS 4: Players of every team
+            TeamPlayer.objects.bulk_create([
+                TeamPlayer(team=team, player=player)
+                for team, players in zip(teams, team_members)
+                for player in players
+            ])
         
         return matches
     
-    def _create_match(self, round_num, court_number, team1_players, team2_players):
-        """Create match with teams and players."""
-        from matches.models import Match, Team, TeamPlayer
+    def _build_match(self, court_number):
+        """Build an (unsaved) match for one court - saved by generate_matches()."""
+        from matches.models import Match
         
-        # Create Match
-        match = Match.objects.create(
+        return Match(
             match_date=self.session_date,
             match_format=MatchFormat.BEST_OF_1,  # Use your actual choice constant
             match_type=MatchType.DOUBLES,
@@ -104,21 +180,3 @@ class RoundRobinGenerator:
             court_location=self.league_session.court_location,
             court_number=str(court_number)
         )
-        
-        # Create Team 1
-        team1 = Team.objects.create(
-            match=match,
-            team_name=f"Round {round_num} Court {court_number}A"
-        )
-        for player in team1_players:
-            TeamPlayer.objects.create(team=team1, player=player)
-        
-        # Create Team 2
-        team2 = Team.objects.create(
-            match=match,
-            team_name=f"Round {round_num} Court {court_number}B"
-        )
-        for player in team2_players:
-            TeamPlayer.objects.create(team=team2, player=player)
-        
-        return match
\ No newline at end of file
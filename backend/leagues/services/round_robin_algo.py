@@ -0,0 +1,73 @@
+"""
+Round-Robin Pattern Algorithm
+
+Builds rotation patterns on the fly with the circle method, for player
+counts that have no RoundRobinPattern row in the database.
+
+Output uses the same structure RoundRobinGenerator reads from
+RoundRobinPattern.pattern_data:
+{
+    "rounds": [
+        {"round_num": 1, "court_1": ((1, 8), (2, 7)), "court_2": ((3, 6), (4, 5))},
+        ...
+    ]
+}
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def circle_method_pattern(num_players, num_courts):
+    """
+    Generate a doubles rotation pattern with the circle method.
+
+    HOW IT WORKS:
+    - Position 1 stays fixed, positions 2..n rotate one step per round
+    - Slot i partners with slot n-1-i → over n-1 rounds every player
+      partners every other player once (when every pair gets a court)
+    - Consecutive partner pairs play each other: pairs 1+2 on court 1,
+      pairs 3+4 on court 2, ...
+    - Odd player count → a bye slot is added; the bye's partner sits out
+    - Pairs beyond num_courts × 2 sit out that round
+
+    ⚡ Pure Python, cached per (num_players, num_courts) - no DB round-trip!
+    ⚠️ Returned dict is SHARED - read it, never mutate it!
+
+    Args:
+        num_players: Number of attending players (positions are 1-based)
+        num_courts: Courts available per round
+
+    Returns:
+        dict: {'rounds': [...]} in RoundRobinPattern.pattern_data format
+    """
+    positions = list(range(1, num_players + 1))
+    if num_players % 2:
+        positions.append(None)  # Bye
+    n = len(positions)
+
+    fixed, rotating = positions[0], positions[1:]
+    rounds = []
+
+    for round_index in range(n - 1):
+        order = [fixed] + rotating
+        pairs = [
+            (order[i], order[n - 1 - i])
+            for i in range(n // 2)
+            if order[i] is not None and order[n - 1 - i] is not None
+        ]
+
+        round_data = {'round_num': round_index + 1}
+        for court_num in range(1, num_courts + 1):
+            if 2 * court_num > len(pairs):
+                break
+            round_data[f'court_{court_num}'] = (
+                pairs[2 * court_num - 2],
+                pairs[2 * court_num - 1],
+            )
+        rounds.append(round_data)
+
+        # Rotate clockwise: last position moves to the front
+        rotating = rotating[-1:] + rotating[:-1]
+
+    return {'rounds': rounds}
@@ -13,10 +13,38 @@ STATUS TRANSITIONS:
 - CANCELLED → PENDING: No attendance records (stays PENDING)
 """
 
+from django.db.models import Count
+from django.utils import timezone
+
 from leagues.models import LeagueParticipation, LeagueAttendance, LeagueSession, SessionOccurrence
 from public.constants import LeagueParticipationStatus, LeagueAttendanceStatus
 
-def handle_participation_status_change(participation, old_status, new_status):
+# ⚡ Max unsaved LeagueAttendance objects held in memory before INSERTing
+ATTENDANCE_BATCH_SIZE = 1000
+
+def is_activation(old_status, new_status):
+    """CASE 1 transition: PENDING/CANCELLED → ACTIVE (creates attendance records)"""
+    return new_status == LeagueParticipationStatus.ACTIVE and (
+        old_status == LeagueParticipationStatus.CANCELLED
+        or old_status == LeagueParticipationStatus.PENDING
+    )
+
+def is_deactivation(old_status, new_status):
+    """CASE 2 transition: ACTIVE → CANCELLED/PENDING (deletes attendance records)"""
+    return old_status == LeagueParticipationStatus.ACTIVE and (
+        new_status == LeagueParticipationStatus.CANCELLED
+        or new_status == LeagueParticipationStatus.PENDING
+    )
+
+# LeagueParticipationStatus → LeagueAttendanceStatus (CASE 3)
+ATTENDANCE_STATUS_MAPPING = {
+    LeagueParticipationStatus.ACTIVE: LeagueAttendanceStatus.ATTENDING,
+    LeagueParticipationStatus.RESERVE: LeagueAttendanceStatus.WAITLIST,
+    LeagueParticipationStatus.INJURED: LeagueAttendanceStatus.ABSENT,
+    LeagueParticipationStatus.HOLIDAY: LeagueAttendanceStatus.ABSENT,
+}
+
+def handle_participation_status_change(participation, old_status, new_status, today=None):
     """
     Handle LeagueAttendance records when participation status changes
     
@@ -24,6 +52,7 @@ def handle_participation_status_change(participation, old_status, new_status):
         participation: LeagueParticipation instance
         old_status: Previous status (int)
         new_status: New status (int)
+        today: Local date (optional - computed when not passed)
     
     Returns:
         dict: {
@@ -36,11 +65,11 @@ def handle_participation_status_change(participation, old_status, new_status):
     # ========================================
     # CASE 1: Changing TO ACTIVE
     # ========================================
-    if new_status == LeagueParticipationStatus.ACTIVE and (old_status == LeagueParticipationStatus.CANCELLED or old_status == LeagueParticipationStatus.PENDING):
+    if is_activation(old_status, new_status):
         # WHY: Member confirmed participation → create attendance records
         # HOW: Create LeagueAttendance for all league sessions
         
-        created_count = create_attendance_records(participation)
+        created_count = create_attendance_records(participation, today=today)
         
         return {
             "attendance_created": created_count,
@@ -51,7 +80,7 @@ def handle_participation_status_change(participation, old_status, new_status):
     # ========================================
     # CASE 2: Changing FROM ACTIVE to non-ACTIVE (CANCELLED/PENDING)
     # ========================================
-    elif old_status == LeagueParticipationStatus.ACTIVE and (new_status == LeagueParticipationStatus.CANCELLED or new_status == LeagueParticipationStatus.PENDING):
+    elif is_deactivation(old_status, new_status):
         # WHY: Member no longer participating → remove attendance records
         # HOW: Delete all LeagueAttendance for this participation
         
@@ -78,87 +107,195 @@ def handle_participation_status_change(participation, old_status, new_status):
         # - PENDING → CANCELLED: No attendance to delete
         # - CANCELLED → PENDING: No attendance to create
         
-        # TODO: UPDATE LeagueAttendance.status based on MAPPING!!! 
-        status_mapping = {
-            LeagueParticipationStatus.ACTIVE: LeagueAttendanceStatus.ATTENDING,
-            LeagueParticipationStatus.RESERVE: LeagueAttendanceStatus.WAITLIST,
-            LeagueParticipationStatus.INJURED: LeagueAttendanceStatus.ABSENT,
-            LeagueParticipationStatus.HOLIDAY: LeagueAttendanceStatus.ABSENT,
-        }
         # get the new attendance status based on the new LeagueParticipation.status
-        new_attendance_status = status_mapping.get(new_status)
+        new_attendance_status = ATTENDANCE_STATUS_MAPPING.get(new_status)
 
-        from django.utils import timezone
-        today = timezone.localtime().date()
+        if new_attendance_status is None:
+            # ✅ No attendance equivalent (e.g. INJURED → CANCELLED): leave
+            # the records alone - status is NOT NULL on LeagueAttendance!
+            updated_count = 0
+        else:
+            if today is None:
+                today = timezone.localdate()
 
-        # get all the future Attendance records for the LeagueParticipation
-        records_to_update = LeagueAttendance.objects.filter(
-            league_participation = participation,
-            session_occurrence__session_date__gte=today 
-        )
-        
-        # Prepare list for bulk_update
-        records_to_update_list = list(records_to_update)
-        
-        # Update status for all records
-        for record in records_to_update_list:
-            record.status = new_attendance_status
-        
-        # Bulk update (efficient - single query!)
-        if records_to_update_list:
-            LeagueAttendance.objects.bulk_update(
-                records_to_update_list,
-                ['status'],  # Only update status field
-                batch_size=100  # Process in batches of 100
-            )
+            # ⚡ ONE SQL UPDATE for all future Attendance records of the
+            # LeagueParticipation - no rows loaded into Python!
+            updated_count = LeagueAttendance.objects.filter(
+                league_participation = participation,
+                session_occurrence__session_date__gte=today 
+            ).update(status=new_attendance_status)
 
         return {
             "attendance_created": 0,
             "attendance_deleted": 0,
-            "attendance_updated": len(records_to_update_list),
-            "message": f"Updated {len(records_to_update_list)} attendance records"
+            "attendance_updated": updated_count,
+            "message": f"Updated {updated_count} attendance records"
         }
 
-def create_attendance_records(participation):
+def handle_bulk_participation_status_change(changes, new_status):
+    """
+    Handle LeagueAttendance records for MANY participations changing to new_status
+    
+    ⚡ Participations are grouped by transition CASE and each group is
+    handled with set-based SQL - O(groups) queries instead of O(N):
+    - CASE 1 (activation): ONE occurrence query per league + bulk INSERT
+    - CASE 2 (deactivation): ONE count query + ONE DELETE
+    - CASE 3 (other): ONE count query + ONE UPDATE
+    
+    Args:
+        changes: List of (participation, old_status) tuples (status already saved)
+        new_status: New status (int)
+    
+    Returns:
+        List of dicts (same shape as handle_participation_status_change),
+        in the order of changes
+    """
+    # ⚡ Local date computed ONCE for all groups
+    today = timezone.localdate()
+    
+    activated, deactivated, other = [], [], []
+    for participation, old_status in changes:
+        if is_activation(old_status, new_status):
+            activated.append(participation)
+        elif is_deactivation(old_status, new_status):
+            deactivated.append(participation.id)
+        else:
+            other.append(participation.id)
+    
+    results = {}
+    
+    # CASE 1: Create attendance records
+    created_counts = create_attendance_records_bulk(activated, today=today)
+    for participation in activated:
+        created_count = created_counts.get(participation.id)
+        results[participation.id] = {
+            "attendance_created": created_count,
+            "attendance_deleted": 0,
+            "message": f"Created {created_count} attendance records"
+        }
+    
+    # CASE 2: Delete attendance records
+    if deactivated:
+        attendance = LeagueAttendance.objects.filter(
+            league_participation_id__in=deactivated
+        )
+        deleted_counts = _count_by_participation(attendance)
+        attendance.delete()
+        for participation_id in deactivated:
+            deleted_count = deleted_counts.get(participation_id, 0)
+            results[participation_id] = {
+                "attendance_created": 0,
+                "attendance_deleted": deleted_count,
+                "message": f"Deleted {deleted_count} attendance records"
+            }
+    
+    # CASE 3: Update future attendance records to the mapped status
+    if other:
+        attendance = LeagueAttendance.objects.filter(
+            league_participation_id__in=other,
+            session_occurrence__session_date__gte=today
+        )
+        new_attendance_status = ATTENDANCE_STATUS_MAPPING.get(new_status)
+        if new_attendance_status is None:
+            # ✅ No attendance equivalent (e.g. INJURED → CANCELLED): leave
+            # the records alone - status is NOT NULL on LeagueAttendance!
+            updated_counts = {}
+        else:
+            updated_counts = _count_by_participation(attendance)
+            attendance.update(status=new_attendance_status)
+        for participation_id in other:
+            updated_count = updated_counts.get(participation_id, 0)
+            results[participation_id] = {
+                "attendance_created": 0,
+                "attendance_deleted": 0,
+                "attendance_updated": updated_count,
+                "message": f"Updated {updated_count} attendance records"
+            }
+    
+    return [results[participation.id] for participation, old_status in changes]
+
+
+def _count_by_participation(attendance):
+    """{participation_id: count} for an attendance queryset - ONE GROUP BY query"""
+    return dict(
+        attendance.order_by()
+        .values_list('league_participation_id')
+        .annotate(count=Count('id'))
+    )
+
+def create_attendance_records(participation, today=None):
     """
     Create LeagueAttendance records for all sessions
     
     HOW: Same logic as @receiver signal
     WHY: Reusable for both signal and manual status changes
     """
-    league = participation.league
+    return create_attendance_records_bulk([participation], today=today).get(participation.id)
 
-    # CHECK: Only do this for Leagues (not events)
-    if league.is_event:
-        return
-    
-    from django.utils import timezone
-    today = timezone.localtime().date()
 
-    future_occurrences = SessionOccurrence.objects.filter(
-        league_session__league=league,
-        session_date__gte=today # Only future sessions
-    )
-
-    # Create attendance records for all future sessions
+def create_attendance_records_bulk(participations, today=None):
+    """
+    Create LeagueAttendance records for all future sessions of MANY participations
+    
+    ⚡ ONE occurrence query per league + bulk INSERTs of ATTENDANCE_BATCH_SIZE
+    (instead of one SELECT + one INSERT per participation)
+    ⚡ Records are flushed per batch - peak memory stays bounded no matter
+    how many sessions × participations there are
+    
+    Returns:
+        dict: {participation_id: created_count} (None for events - skipped!)
+    """
+    if today is None:
+        today = timezone.localdate()
+    
+    created_counts = {}
+    occurrence_ids_by_league = {}
     attendance_records = []
-    for occurrence in future_occurrences:
-        attendance_records.append(
-            LeagueAttendance(
-                league_participation=participation,
-                session_occurrence=occurrence,
-                status=LeagueAttendanceStatus.ATTENDING
+    
+    for participation in participations:
+        league = participation.league
+
+        # CHECK: Only do this for Leagues (not events)
+        if league.is_event:
+            created_counts[participation.id] = None
+            continue
+        
+        # ⚡ Future occurrences fetched ONCE per league (ids only)
+        occurrence_ids = occurrence_ids_by_league.get(league.id)
+        if occurrence_ids is None:
+            occurrence_ids = list(SessionOccurrence.objects.filter(
+                league_session__league=league,
+                session_date__gte=today # Only future sessions
+            ).values_list('id', flat=True))
+            occurrence_ids_by_league[league.id] = occurrence_ids
+        
+        # Create attendance records for all future sessions
+        for occurrence_id in occurrence_ids:
+            attendance_records.append(
+                LeagueAttendance(
+                    league_participation=participation,
+                    session_occurrence_id=occurrence_id,
+                    status=LeagueAttendanceStatus.ATTENDING
+                )
             )
-        )
+            if len(attendance_records) >= ATTENDANCE_BATCH_SIZE:
+                _flush_attendance_records(attendance_records)
+        created_counts[participation.id] = len(occurrence_ids)
     
-    # Bulk create all attendance records
+    # Bulk create the remaining attendance records
+    _flush_attendance_records(attendance_records)
+   
+    return created_counts
+
+
+def _flush_attendance_records(attendance_records):
+    """INSERT the buffered attendance records, then empty the buffer"""
     if attendance_records:
         LeagueAttendance.objects.bulk_create(
             attendance_records,
             ignore_conflicts=True # In case records already exist
         )
-   
-    return len(attendance_records)
+        attendance_records.clear()
 
 
 def delete_attendance_records(participation):
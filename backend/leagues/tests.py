@@ -1,3 +1,589 @@
+import math
+from datetime import time, timedelta
+from itertools import combinations
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.request import Request
+from rest_framework import serializers, status
+from rest_framework.test import APIClient, APIRequestFactory
+
+from clubs.models import Club, ClubMembership, ClubMembershipSkillLevel, ClubMembershipType, Role
+from courts.models import CourtLocation
+from leagues.models import (
+    League, LeagueAttendance, LeagueParticipation, LeagueSession, RoundRobinPattern, SessionOccurrence
+)
+from leagues.serializers import (
+    BulkLeagueParticipationStatusSerializer, LeagueSerializer, NextOccurrenceSerializer
+)
+from leagues.services.round_robin import RoundRobinGenerator, _load_pattern
+from leagues.services.round_robin_algo import circle_method_pattern
+from leagues.services.status_change import (
+    create_attendance_records_bulk, handle_bulk_participation_status_change,
+    handle_participation_status_change
+)
+from leagues.views import AdminEventsViewSet, AdminLeagueParticipantsViewSet
+from matches.models import Match, Team
+from public.constants import (
+    LeagueAttendanceStatus, LeagueParticipationStatus, MembershipStatus, RecurrenceType, RoleType,
+    SkillLevel
+)
+
+User = get_user_model()
+
+
+class LeagueFixtureMixin:
+    """
+    Club + ACTIVE members + a weekly league with future SessionOccurrences
+
+    ⚠️ ONE club per test class: ClubMembership.save() looks up the MEMBER
+    role by name only (one per club → MultipleObjectsReturned)
+    """
+
+    @classmethod
+    def create_league(cls, num_members):
+        today = timezone.localdate()
+        cls.club = Club.objects.create(name='PSJ')
+        membership_type = ClubMembershipType.objects.create(club=cls.club, name='Resident')
+        cls.members = [
+            User.objects.create_user(username=f'u{i}', email=f'u{i}@x.com', password='p')
+            for i in range(num_members)
+        ]
+        cls.memberships = [
+            ClubMembership.objects.create(
+                member=member, club=cls.club, type=membership_type,
+                membership_number=f'M{i}', status=MembershipStatus.ACTIVE
+            )
+            for i, member in enumerate(cls.members)
+        ]
+        cls.league = League.objects.create(
+            name='Rising Stars', club=cls.club,
+            start_date=today - timedelta(days=7), end_date=today + timedelta(days=60)
+        )
+        LeagueSession.objects.create(
+            league=cls.league, court_location=CourtLocation.objects.create(name='Parc'),
+            day_of_week=today.weekday(), start_time=time(8), end_time=time(10),
+            recurrence_type=RecurrenceType.WEEKLY, courts_used=2
+        )
+
+    def participate(self, index, status):
+        """LeagueParticipation for member index (ACTIVE → signal creates attendance)"""
+        return LeagueParticipation.objects.create(
+            league=self.league, member=self.members[index],
+            club_membership=self.memberships[index], status=status
+        )
+
+    def attendance_statuses(self, participation):
+        return set(
+            LeagueAttendance.objects.filter(league_participation=participation)
+            .values_list('status', flat=True)
+        )
+
+
+class IsLeagueAdminObjectPermissionTests(TestCase):
+    """
+    IsLeagueAdmin object-level checks for NON-superusers
+
+    AdminEventsViewSet passes a League, AdminLeagueParticipantsViewSet
+    passes a LeagueParticipation - both must resolve to the league's club!
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.club = Club.objects.create(name='PSJ')
+        membership_type = ClubMembershipType.objects.create(club=cls.club, name='Resident')
+
+        cls.admin = User.objects.create_user(username='admin', email='admin@x.com', password='p')
+        cls.member = User.objects.create_user(username='member', email='member@x.com', password='p')
+
+        admin_membership = ClubMembership.objects.create(
+            member=cls.admin, club=cls.club, type=membership_type,
+            membership_number='M1', status=MembershipStatus.ACTIVE
+        )
+        admin_membership.roles.add(Role.objects.get(club=cls.club, name=RoleType.ADMIN))
+        member_membership = ClubMembership.objects.create(
+            member=cls.member, club=cls.club, type=membership_type,
+            membership_number='M2', status=MembershipStatus.ACTIVE
+        )
+
+        # ⚠️ After the memberships: ClubMembership.save() looks up the
+        # MEMBER role by name only (one per club → MultipleObjectsReturned)
+        cls.other_club = Club.objects.create(name='Other')
+
+        cls.league = League.objects.create(name='Rising Stars', club=cls.club, captain=cls.admin)
+        cls.other_league = League.objects.create(name='Elsewhere', club=cls.other_club, captain=cls.admin)
+        cls.participation = LeagueParticipation.objects.create(
+            league=cls.league, member=cls.member, club_membership=member_membership,
+            status=LeagueParticipationStatus.ACTIVE
+        )
+
+    def make_view(self, viewset_class, user):
+        """ViewSet instance wired to a request for user (like DRF's dispatch does)"""
+        request = Request(APIRequestFactory().get('/'))
+        request.user = user
+        view = viewset_class(request=request, kwargs={}, format_kwarg=None)
+        return view, request
+
+    def test_admin_passes_league_object_check(self):
+        view, request = self.make_view(AdminEventsViewSet, self.admin)
+        view.check_object_permissions(request, self.league)
+
+    def test_admin_passes_participation_object_check(self):
+        view, request = self.make_view(AdminLeagueParticipantsViewSet, self.admin)
+        view.check_object_permissions(request, self.participation)
+
+    def test_member_without_role_is_denied(self):
+        for viewset_class, obj in [
+            (AdminEventsViewSet, self.league),
+            (AdminLeagueParticipantsViewSet, self.participation),
+        ]:
+            view, request = self.make_view(viewset_class, self.member)
+            with self.subTest(viewset=viewset_class.__name__):
+                with self.assertRaises(PermissionDenied):
+                    view.check_object_permissions(request, obj)
+
+    def test_bulk_check_requires_admin_in_every_club(self):
+        view, request = self.make_view(AdminLeagueParticipantsViewSet, self.admin)
+        view.check_leagues_permissions(request, [self.league])
+
+        with self.assertRaises(PermissionDenied):
+            view.check_leagues_permissions(request, [self.league, self.other_league])
+
+
+class LeagueCreateTests(TestCase):
+    """POST/PATCH /api/leagues/ - club is a write-only FK, club_info is output only"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.club = Club.objects.create(name='PSJ')
+        cls.user = User.objects.create_user(username='organizer', email='org@x.com', password='p')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_missing_or_unknown_club_is_a_400(self):
+        for payload in [{'name': 'New'}, {'name': 'New', 'club': 9999}]:
+            with self.subTest(payload=payload):
+                response = self.client.post('/api/leagues/', payload, format='json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('club', response.json())
+
+    def test_create_without_captain_returns_club_info(self):
+        response = self.client.post('/api/leagues/', {'name': 'New', 'club': self.club.id}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        data = response.json()
+        self.assertEqual(data['club_info']['id'], self.club.id)
+        self.assertIsNone(data['captain_info'])
+        self.assertEqual(data['participants_count'], 0)
+        self.assertIsNone(data['minimum_skill_level'])
+        self.assertNotIn('club', data)
+
+    def test_update_returns_skill_level_from_annotation(self):
+        skill_level = ClubMembershipSkillLevel.objects.create(level=SkillLevel.ADVANCED_PLUS)
+        league = League.objects.create(name='Old', club=self.club, minimum_skill_level=skill_level)
+
+        response = self.client.patch(f'/api/leagues/{league.id}/', {'name': 'Renamed'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['minimum_skill_level'], SkillLevel.ADVANCED_PLUS)
+
+
+class BulkParticipationStatusChangeTests(LeagueFixtureMixin, TestCase):
+    """handle_bulk_participation_status_change + BulkLeagueParticipationStatusSerializer"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.create_league(num_members=3)
+
+    def future_occurrence_count(self):
+        return SessionOccurrence.objects.filter(
+            league=self.league, session_date__gte=timezone.localdate()
+        ).count()
+
+    def change_status(self, participations, new_status):
+        """Save new_status like the serializer does, then sync attendance"""
+        changes = []
+        for participation in participations:
+            changes.append((participation, participation.status))
+            participation.status = new_status
+            participation.save()
+        return handle_bulk_participation_status_change(changes, new_status)
+
+    def test_activation_creates_attendance(self):
+        # CASE 1: PENDING/CANCELLED → ACTIVE
+        participations = [
+            self.participate(0, LeagueParticipationStatus.PENDING),
+            self.participate(1, LeagueParticipationStatus.CANCELLED),
+        ]
+        expected = self.future_occurrence_count()
+        self.assertGreater(expected, 0)
+
+        results = self.change_status(participations, LeagueParticipationStatus.ACTIVE)
+
+        for participation, result in zip(participations, results):
+            self.assertEqual(result['attendance_created'], expected)
+            self.assertEqual(result['attendance_deleted'], 0)
+            self.assertEqual(
+                LeagueAttendance.objects.filter(
+                    league_participation=participation, status=LeagueAttendanceStatus.ATTENDING
+                ).count(),
+                expected
+            )
+
+    def test_deactivation_deletes_attendance(self):
+        # CASE 2: ACTIVE → CANCELLED/PENDING
+        participations = [
+            self.participate(0, LeagueParticipationStatus.ACTIVE),
+            self.participate(1, LeagueParticipationStatus.ACTIVE),
+        ]
+        expected = self.future_occurrence_count()
+
+        results = self.change_status(participations, LeagueParticipationStatus.CANCELLED)
+
+        self.assertEqual(
+            [(result['attendance_created'], result['attendance_deleted']) for result in results],
+            [(0, expected), (0, expected)]
+        )
+        self.assertFalse(LeagueAttendance.objects.filter(league_participation__in=participations).exists())
+
+    def test_other_transition_updates_future_attendance(self):
+        # CASE 3: ACTIVE → INJURED (mapped to ABSENT)
+        participations = [
+            self.participate(0, LeagueParticipationStatus.ACTIVE),
+            self.participate(1, LeagueParticipationStatus.ACTIVE),
+        ]
+        expected = self.future_occurrence_count()
+
+        results = self.change_status(participations, LeagueParticipationStatus.INJURED)
+
+        for participation, result in zip(participations, results):
+            self.assertEqual(result['attendance_updated'], expected)
+            self.assertEqual(self.attendance_statuses(participation), {LeagueAttendanceStatus.ABSENT})
+
+    def test_mixed_cases_return_results_in_input_order(self):
+        # → ACTIVE: PENDING is CASE 1, RESERVE is CASE 3 (mapped to ATTENDING)
+        pending = self.participate(0, LeagueParticipationStatus.PENDING)
+        reserve = self.participate(1, LeagueParticipationStatus.RESERVE)
+        expected = self.future_occurrence_count()
+
+        results = self.change_status([reserve, pending], LeagueParticipationStatus.ACTIVE)
+
+        self.assertEqual(results[0]['attendance_updated'], 0)  # RESERVE had no records
+        self.assertEqual(results[1]['attendance_created'], expected)
+        self.assertEqual(self.attendance_statuses(pending), {LeagueAttendanceStatus.ATTENDING})
+
+    def test_status_without_attendance_mapping_leaves_attendance_alone(self):
+        # INJURED → CANCELLED is CASE 3, but CANCELLED has no attendance status
+        participation = self.participate(0, LeagueParticipationStatus.ACTIVE)
+        LeagueAttendance.objects.filter(league_participation=participation).update(
+            status=LeagueAttendanceStatus.ABSENT
+        )
+        participation.status = LeagueParticipationStatus.CANCELLED
+        participation.save()
+
+        [result] = handle_bulk_participation_status_change(
+            [(participation, LeagueParticipationStatus.INJURED)], LeagueParticipationStatus.CANCELLED
+        )
+
+        self.assertEqual(result['attendance_updated'], 0)
+        self.assertEqual(self.attendance_statuses(participation), {LeagueAttendanceStatus.ABSENT})
+
+    def test_attendance_error_rolls_back_status_saves(self):
+        participations = [
+            self.participate(0, LeagueParticipationStatus.PENDING),
+            self.participate(1, LeagueParticipationStatus.PENDING),
+        ]
+        serializer = BulkLeagueParticipationStatusSerializer(
+            participations, data={'status': LeagueParticipationStatus.ACTIVE}, partial=True
+        )
+        self.assertTrue(serializer.is_valid())
+
+        with mock.patch(
+            'leagues.services.status_change.handle_bulk_participation_status_change',
+            side_effect=RuntimeError('attendance sync failed')
+        ):
+            with self.assertRaises(RuntimeError):
+                serializer.save()
+
+        self.assertEqual(
+            set(LeagueParticipation.objects.values_list('status', flat=True)),
+            {LeagueParticipationStatus.PENDING}
+        )
+
+
+class ParticipationStatusChangeTests(LeagueFixtureMixin, TestCase):
+    """handle_participation_status_change (single participation)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.create_league(num_members=1)
+
+    def test_status_without_attendance_mapping_leaves_attendance_alone(self):
+        participation = self.participate(0, LeagueParticipationStatus.ACTIVE)
+        LeagueAttendance.objects.filter(league_participation=participation).update(
+            status=LeagueAttendanceStatus.ABSENT
+        )
+
+        result = handle_participation_status_change(
+            participation, LeagueParticipationStatus.INJURED, LeagueParticipationStatus.CANCELLED
+        )
+
+        self.assertEqual(result['attendance_updated'], 0)
+        self.assertEqual(self.attendance_statuses(participation), {LeagueAttendanceStatus.ABSENT})
+
+
+class RoundRobinPatternCacheTests(TestCase):
+    """_load_pattern() caches in Django's cache, edits bump the key version"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_pattern_edit_invalidates_cached_pattern(self):
+        pattern = RoundRobinPattern.objects.create(
+            num_players=5, name='5 players', pattern_data={'rounds': []}
+        )
+        self.assertEqual(_load_pattern(5), {'rounds': []})
+
+        with self.assertNumQueries(0):
+            _load_pattern(5)
+
+        pattern.pattern_data = {'rounds': [{'round_num': 1}]}
+        pattern.save()
+
+        self.assertEqual(_load_pattern(5), {'rounds': [{'round_num': 1}]})
+
+
+class LeagueListCountCacheTests(TestCase):
+    """LeagueViewSet caches COUNT(*) while paging - league writes drop it"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.club = Club.objects.create(name='PSJ')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_new_league_shows_up_in_cached_count(self):
+        League.objects.create(name='First', club=self.club)
+        self.assertEqual(self.client.get('/api/leagues/').json()['count'], 1)
+
+        League.objects.create(name='Second', club=self.club)
+        self.assertEqual(self.client.get('/api/leagues/').json()['count'], 2)
+
+
+class AdminParticipantsPrefetchTests(LeagueFixtureMixin, TestCase):
+    """AdminLeagueParticipantsViewSet list - AutoPrefetchMixin joins/prefetches club_membership"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.create_league(num_members=4)
+        cls.admin = User.objects.create_superuser(username='root', email='root@x.com', password='p')
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def list_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/admin/participants/', {'league': self.league.id})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(queries)
+
+    def test_auto_prefetch_removes_per_row_queries(self):
+        for index in range(4):
+            self.participate(index, LeagueParticipationStatus.ACTIVE)
+        prefetched = self.list_queries()
+
+        with mock.patch.object(
+            AdminLeagueParticipantsViewSet, 'auto_prefetch', lambda self, queryset: queryset
+        ):
+            self.assertGreater(self.list_queries(), prefetched)
+
+
+class CachedFieldsMixinTests(TestCase):
+    """
+    Fields are built ONCE per class (process-wide) - the context-dependent
+    get_fields() pops must stay per serializer instance
+    """
+
+    USER_FIELDS = {'user_is_captain', 'user_is_participant'}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='member', email='member@x.com', password='p')
+
+    def make_context(self, **flags):
+        request = Request(APIRequestFactory().get('/'))
+        request.user = self.user
+        return {'request': request, **flags}
+
+    def test_popped_fields_do_not_leak_between_requests(self):
+        trimmed = LeagueSerializer(context=self.make_context(include_counts=False))
+        self.assertNotIn('participants_count', trimmed.fields)
+        self.assertFalse(self.USER_FIELDS & set(trimmed.fields))
+
+        full = LeagueSerializer(context=self.make_context(include_user_participation=True))
+        self.assertIn('participants_count', full.fields)
+        self.assertLessEqual(self.USER_FIELDS, set(full.fields))
+
+        trimmed_again = LeagueSerializer(context=self.make_context(include_counts=False))
+        self.assertNotIn('participants_count', trimmed_again.fields)
+        self.assertFalse(self.USER_FIELDS & set(trimmed_again.fields))
+
+    def test_fields_are_bound_per_instance(self):
+        first = LeagueSerializer(context=self.make_context())
+        second = LeagueSerializer(context=self.make_context())
+
+        for name in ['name', 'recurring_days', 'club']:
+            with self.subTest(field=name):
+                self.assertIsNot(first.fields[name], second.fields[name])
+                self.assertIs(first.fields[name].parent, first)
+                self.assertIs(second.fields[name].parent, second)
+
+
+class NextOccurrenceSerializerTests(LeagueFixtureMixin, TestCase):
+    """Manual to_representation() must match the declared fields' output"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.create_league(num_members=2)
+
+    def setUp(self):
+        self.participate(0, LeagueParticipationStatus.ACTIVE)
+        self.participate(1, LeagueParticipationStatus.ACTIVE)
+        self.occurrence_id = SessionOccurrence.objects.filter(
+            league=self.league, session_date__gte=timezone.localdate()
+        ).earliest('session_date').id
+
+    def assert_matches_field_output(self, occurrence):
+        serializer = NextOccurrenceSerializer(context={})
+        manual = serializer.to_representation(occurrence)
+
+        self.assertEqual(manual, serializers.Serializer.to_representation(serializer, occurrence))
+        self.assertEqual(manual['participants_count'], 2)
+
+    def test_annotated_occurrence(self):
+        occurrence = SessionOccurrence.objects.for_serializer().get(id=self.occurrence_id)
+        self.assertEqual(occurrence.attending_count, 2)
+        self.assert_matches_field_output(occurrence)
+
+    def test_unannotated_occurrence_falls_back_to_count(self):
+        occurrence = SessionOccurrence.objects.get(id=self.occurrence_id)
+        self.assertFalse(hasattr(occurrence, 'attending_count'))
+        self.assert_matches_field_output(occurrence)
+
+
+class CircleMethodPatternTests(TestCase):
+    """circle_method_pattern() - fallback when no RoundRobinPattern is stored"""
+
+    def test_every_pair_partners_once_with_at_most_one_bye_per_round(self):
+        for num_players, num_courts in [(8, 2), (9, 2), (12, 3), (13, 3)]:
+            with self.subTest(num_players=num_players, num_courts=num_courts):
+                pattern = circle_method_pattern(num_players, num_courts)
+                partner_pairs = []
+
+                for round_data in pattern['rounds']:
+                    playing = []
+                    for court_num in range(1, num_courts + 1):
+                        team1, team2 = round_data[f'court_{court_num}']
+                        partner_pairs += [frozenset(team1), frozenset(team2)]
+                        playing += [*team1, *team2]
+
+                    self.assertEqual(len(playing), len(set(playing)))  # Nobody plays twice
+                    self.assertLessEqual(num_players - len(playing), 1)  # At most one bye
+
+                self.assertEqual(len(partner_pairs), len(set(partner_pairs)))
+                self.assertEqual(
+                    set(partner_pairs),
+                    {frozenset(pair) for pair in combinations(range(1, num_players + 1), 2)}
+                )
+
+
+class RoundRobinGeneratorTests(LeagueFixtureMixin, TestCase):
+    """generate_matches() bulk-creates the same line-up the per-court saves did"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.create_league(num_members=8)
+        cls.league_session = cls.league.sessions.get()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_bulk_created_matches_follow_the_pattern(self):
+        generator = RoundRobinGenerator(self.league_session, timezone.localdate(), self.members)
+        matches = generator.generate_matches()
+
+        # Old _create_match(): one Match per court per round, teams
+        # 'Round {r} Court {c}A/B' with the pattern's positions (1-based)
+        expected = set()
+        for round_data in circle_method_pattern(8, 2)['rounds']:
+            for court_num in (1, 2):
+                for side, positions in zip('AB', round_data[f'court_{court_num}']):
+                    expected.add((
+                        str(court_num),
+                        f"Round {round_data['round_num']} Court {court_num}{side}",
+                        frozenset(self.members[position - 1].id for position in positions),
+                    ))
+
+        self.assertEqual(len(matches), 14)
+        self.assertTrue(all(match.pk for match in matches))
+        self.assertEqual(Match.objects.filter(league=self.league).count(), 14)
+
+        teams = Team.objects.filter(match__league=self.league).prefetch_related('team_players')
+        self.assertEqual(
+            {
+                (team.match.court_number, team.team_name,
+                 frozenset(team_player.player_id for team_player in team.team_players.all()))
+                for team in teams.select_related('match')
+            },
+            expected
+        )
+        for match in Match.objects.filter(league=self.league):
+            with self.subTest(match=match.pk):
+                self.assertEqual(match.match_date, timezone.localdate())
+                self.assertEqual(match.court_location_id, self.league_session.court_location_id)
+                self.assertEqual(match.teams.count(), 2)
+
+
+class AttendanceBatchTests(LeagueFixtureMixin, TestCase):
+    """create_attendance_records_bulk() flushes every ATTENDANCE_BATCH_SIZE records"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.create_league(num_members=3)
+
+    def test_records_beyond_batch_size_are_all_created(self):
+        participations = [self.participate(i, LeagueParticipationStatus.PENDING) for i in range(3)]
+        per_participation = SessionOccurrence.objects.filter(
+            league=self.league, session_date__gte=timezone.localdate()
+        ).count()
+        total = per_participation * len(participations)
+        batch_size = 4
+        self.assertGreater(total, 2 * batch_size)
+
+        batch_sizes = []
+        bulk_create = LeagueAttendance.objects.bulk_create
+
+        def recording_bulk_create(records, **kwargs):
+            batch_sizes.append(len(records))
+            return bulk_create(records, **kwargs)
+
+        with mock.patch('leagues.services.status_change.ATTENDANCE_BATCH_SIZE', batch_size), \
+                mock.patch.object(LeagueAttendance.objects, 'bulk_create', side_effect=recording_bulk_create):
+            created_counts = create_attendance_records_bulk(participations)
 
-# Create your tests here.
+        self.assertEqual(created_counts, {p.id: per_participation for p in participations})
+        self.assertEqual(sum(batch_sizes), total)
+        self.assertLessEqual(max(batch_sizes), batch_size)
+        self.assertEqual(len(batch_sizes), math.ceil(total / batch_size))
+        self.assertEqual(
+            LeagueAttendance.objects.filter(league_participation__in=participations).count(), total
+        )
@@ -1,6 +1,7 @@
 # leagues/views.py
-from django.db.models import Exists, OuterRef, Q, Case, When, BooleanField, Count, Min
+from django.db.models import Exists, OuterRef, Subquery, BooleanField, ExpressionWrapper, Prefetch
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.shortcuts import get_object_or_404
 from django.contrib.auth import get_user_model
 from rest_framework import viewsets, filters, status
@@ -8,17 +9,18 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
-from django_filters.rest_framework import DjangoFilterBackend
 
-from .models import League, LeagueParticipation, LeagueAttendance, SessionOccurrence
+from .models import League, LeagueParticipation, LeagueAttendance, LeagueSession, SessionOccurrence
 from .serializers import LeagueSerializer, LeagueDetailSerializer, AdminLeagueListSerializer, AdminLeagueDetailSerializer, AdminLeagueParticipationSerializer, BulkLeagueParticipationStatusSerializer
 from .filters import LeagueFilter, ParticipationFilter  # ✅ NEW: Import custom filter!
 from .permissions import IsLeagueAdmin
 
 from clubs.models import ClubMembership
-from users.serializers import UserInfoSerializer, UserDetailSerializer
-from public.constants import LeagueParticipationStatus, LeagueAttendanceStatus, MembershipStatus
-from public.pagination import StandardPagination
+from users.serializers import UserDetailSerializer
+from public.constants import LeagueParticipationStatus, LeagueAttendanceStatus, MembershipStatus, RecurrenceType
+from public.pagination import CachedCountPagination, StandardPagination
+from public.filters import OptionalDjangoFilterBackend
+from public.mixins import AutoPrefetchMixin
 
 User = get_user_model()
 
@@ -34,6 +36,7 @@ class LeagueViewSet(viewsets.ModelViewSet):
     - GET    /api/leagues/?status=past                           → list (past only)
     - GET    /api/leagues/?club=5                                → list (for specific club)
     - GET    /api/leagues/?include_user_participation=true       → list (with user data - auth required)
+    - GET    /api/leagues/?include_counts=false                  → list (without participants_count)
     - GET    /api/leagues/?search=beginner                       → search by name/description
     - GET    /api/leagues/?ordering=-start_date                  → order results
     - GET    /api/leagues/{id}/                                  → retrieve
@@ -60,15 +63,19 @@ class LeagueViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticatedOrReadOnly]  # ✅ Public can browse!
     
     # ✅ NEW: Add pagination (Django handles automatically for list endpoint!)
-    pagination_class = StandardPagination
+    # ⚡ COUNT(*) cached per filter combination while paging
+    # ⚠️ STALENESS: League/SessionOccurrence save + delete drop the cached
+    # counts (leagues/models.py signals) - bulk writes that skip signals
+    # (queryset.update(), bulk_create) can leave "count" off for up to 60s
+    pagination_class = CachedCountPagination
     
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [OptionalDjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     
     # ✅ USE CUSTOM FILTERSET (instead of filterset_fields)
     filterset_class = LeagueFilter  # ← Uses constants from public.constants!
     
     # ✅ Enable search
-    search_fields = ['name', 'description', 'captain__get_full_name']
+    search_fields = ['name', 'description', 'captain__first_name', 'captain__last_name']
     
     # ✅ Enable ordering
     # ⚡ BUGFIX 2026-01-22: Use earliest_session_date instead of start_date!
@@ -77,6 +84,21 @@ class LeagueViewSet(viewsets.ModelViewSet):
     ordering_fields = ['earliest_session_date', 'created_at', 'name']
     ordering = ['earliest_session_date']  # Default: soonest upcoming first
     
+    # ⚡ LIST ONLY: Exactly the columns LeagueSerializer reads
+    # (incl. the select_related club/captain/skill level rows!)
+    # Keep in sync with LeagueSerializer.Meta.fields + CaptainInfoMixin!
+    LIST_FIELDS = (
+        'id', 'name', 'description', 'is_event',
+        'max_participants', 'allow_reserves', 'fee',
+        'start_date', 'end_date', 'image_url', 'league_type', 'is_active',
+        # club_info (LeagueSerializer.to_representation)
+        'club__id', 'club__name', 'club__logo_url', 'club__club_type', 'club__short_name',
+        # captain_info (CaptainInfoMixin)
+        'captain__id', 'captain__first_name', 'captain__last_name',
+        'captain__username', 'captain__profile_picture_url',
+        # (minimum_skill_level → with_skill_level() annotation)
+    )
+    
     def get_serializer_class(self):
         """Use different serializers for list vs detail"""
         if self.action == 'list':
@@ -105,83 +127,151 @@ class LeagueViewSet(viewsets.ModelViewSet):
         if not self.request.user.is_staff:
             queryset = queryset.filter(is_active=True)
         
-        # ✅ PREFETCH: Related data (club, captain, skill level)
-        queryset = queryset.select_related(
-            'club',
-            'minimum_skill_level',
-            'captain'
-        )
+        # ⚡ LIST ONLY: Load just the columns LeagueSerializer reads
+        # Detail keeps full rows (LeagueDetailSerializer reads more!)
+        if self.action == 'list':
+            queryset = queryset.only(*self.LIST_FIELDS)
+        
         # ⚡ ANNOTATION 0: Add earliest_session_date for ordering!
         # This is what users actually care about - when's the next session?
-        today = timezone.localtime().date()
-        queryset = queryset.annotate(
-            earliest_session_date=Min(
-                'all_occurrences__session_date',
-                filter=Q(
-                    all_occurrences__session_date__gte=today,
-                    all_occurrences__is_cancelled=False
-                )
-            )
-        )
-        # ⚡ ANNOTATION 1: Always count participants (needed by serializer!)
-        # For leagues: Total active participants
-        # For events: Serializer uses next_occurrence.attendance_count instead
-        queryset = queryset.annotate(
-            league_participants_count=Count(
-                'league_participants',
-                filter=Q(league_participants__status=LeagueParticipationStatus.ACTIVE), 
-                distinct=True
-            )
+        today = self._today
+        queryset = queryset.with_earliest_session_date(today)
+        # ⚡ ANNOTATIONS + PREFETCHES the serializer reads (captain, club,
+        # skill level, participants count, recurring days, occurrences)
+        # Declared next to the fields on the serializer - list and detail
+        # can't drift out of sync with what they serialize!
+        # ⚡ include_counts=false skips the participants COUNT aggregate
+        queryset = self.get_serializer_class().get_optimized_queryset(
+            queryset, include_counts=self._include_counts
         )
         
+        # ⚡ Per-user annotations are collected here and applied in ONE
+        # annotate() call below (one queryset clone, not one per annotation)
+        annotations = {}
+        
         # ✅ OPTIMIZATION: Add user participation data if requested
         include_participation = self.request.query_params.get('include_user_participation') == 'true'
         
         if include_participation and self.request.user.is_authenticated:
             user = self.request.user
             
-            # ✅ ANNOTATION 2: Check if user is captain
-            queryset = queryset.annotate(
-                user_is_captain=Case(
-                    When(captain=user, then=True),
-                    default=False,
-                    output_field=BooleanField()
+            # ✅ user_is_captain: computed by LeagueSerializer from captain_id
+            
+            # ✅ ANNOTATION 2: Check if user is participant
+            # ⚡ EXISTS in the main query - cheaper than prefetching the
+            # user's participations (no extra query, no per-row list)
+            annotations['user_is_participant'] = Exists(
+                LeagueParticipation.objects.filter(
+                    league=OuterRef('pk'),
+                    member=user,
+                    status__in=[
+                        LeagueParticipationStatus.ACTIVE,
+                        LeagueParticipationStatus.RESERVE
+                    ]
                 )
             )
-            
-            # ✅ ANNOTATION 3: Check if user is participant
-            queryset = queryset.annotate(
-                user_is_participant=Exists(
-                    LeagueParticipation.objects.filter(
-                        league=OuterRef('pk'),
-                        member=user,
-                        status__in=[
-                            LeagueParticipationStatus.ACTIVE,
-                            LeagueParticipationStatus.RESERVE
-                        ]
+        
+        # ✅ ANNOTATION 4: Recurring events - is user enrolled in ANY upcoming session?
+        # ⚡ EXISTS in the main query instead of one query per league!
+        if self.request.user.is_authenticated:
+            annotations['user_has_upcoming_sessions'] = ExpressionWrapper(
+                Exists(
+                    LeagueSession.objects.filter(
+                        league=OuterRef('pk')
+                    ).exclude(recurrence_type=RecurrenceType.ONCE)
+                ) & Exists(
+                    LeagueAttendance.objects.filter(
+                        league_participation__league=OuterRef('pk'),
+                        league_participation__member=self.request.user,
+                        session_occurrence__session_date__gte=today,
+                        session_occurrence__is_cancelled=False,
+                        status=LeagueAttendanceStatus.ATTENDING
                     )
-                )
+                ),
+                output_field=BooleanField()
             )
+        
+        # ✅ ANNOTATION 5: Detail only - user's next attending session
+        # ⚡ Subquery instead of a per-league query in the serializer!
+        if self.action != 'list' and self.request.user.is_authenticated:
+            next_attendance = LeagueAttendance.objects.filter(
+                league_participation__league=OuterRef('pk'),
+                league_participation__member=self.request.user,
+                session_occurrence__session_date__gte=today,
+                session_occurrence__is_cancelled=False,
+                status=LeagueAttendanceStatus.ATTENDING
+            ).order_by(
+                'session_occurrence__session_date',
+                'session_occurrence__start_datetime'
+            ).values('session_occurrence_id')[:1]
             
-            # 🐛 DEBUG: Check first item if it's a retrieve action
-            if self.action == 'retrieve' and queryset.exists():
-                first = queryset.first()
-                print(f"🐛 RETRIEVE action - League: {first.name}")
-                print(f"🐛 Has user_is_captain attr: {hasattr(first, 'user_is_captain')}")
-                print(f"🐛 Has user_is_participant attr: {hasattr(first, 'user_is_participant')}")
-                if hasattr(first, 'user_is_captain'):
-                    print(f"🐛 user_is_captain value: {first.user_is_captain}")
-                if hasattr(first, 'user_is_participant'):
-                    print(f"🐛 user_is_participant value: {first.user_is_participant}")
+            annotations['user_next_session_id'] = Subquery(next_attendance)
+        
+        if annotations:
+            queryset = queryset.annotate(**annotations)
         
         return queryset
     
+    @property
+    def _include_counts(self):
+        """participants_count is included unless ?include_counts=false"""
+        return self.request.query_params.get('include_counts') != 'false'
+    
+    @cached_property
+    def _today(self):
+        """ONE timezone.localdate() per request (shared by the get_queryset subqueries)"""
+        return timezone.localdate()
+    
     def get_serializer_context(self):
         """Pass request context to serializer"""
         context = super().get_serializer_context()
         context['include_user_participation'] = self.request.query_params.get('include_user_participation') == 'true'
+        context['include_counts'] = self._include_counts
         return context
     
+    def get_serializer(self, *args, **kwargs):
+        """
+        list / retrieve: add the user's attendance for the occurrences
+        being serialized to the context (user_att_by_occ)
+        
+        ⚡ Built AFTER pagination from the page's leagues (or the retrieved
+        league) - ONE query that grows with the page, not with the user's
+        whole schedule. Other actions never render occurrences → no query!
+        """
+        if args and self.action in ('list', 'retrieve') and self.request.user.is_authenticated:
+            kwargs.setdefault('context', self.get_serializer_context())
+            kwargs['context']['user_att_by_occ'] = self._user_attendance_by_occurrence(args[0])
+        return super().get_serializer(*args, **kwargs)
+    
+    def _user_attendance_by_occurrence(self, leagues):
+        """
+        {occurrence_id: status} for the PREFETCHED occurrences of leagues
+        (next occurrence, one-time session, upcoming occurrences)
+        
+        Every covered occurrence is a key - None = no attendance record.
+        NextOccurrenceSerializer queries only for occurrences not covered.
+        """
+        if isinstance(leagues, League):
+            leagues = [leagues]
+        
+        occurrence_ids = set()
+        for league in leagues:
+            # ⚡ Prefetched lists only - never trigger the model properties' queries
+            for attr in ('_next_occurrences', '_one_time_sessions', 'upcoming_occurrences_list'):
+                occurrence_ids.update(occurrence.id for occurrence in getattr(league, attr, ()))
+        
+        if not occurrence_ids:
+            return {}
+        
+        user_att_by_occ = dict.fromkeys(occurrence_ids)
+        user_att_by_occ.update(
+            LeagueAttendance.objects.filter(
+                league_participation__member=self.request.user,
+                session_occurrence_id__in=occurrence_ids
+            ).values_list('session_occurrence_id', 'status')
+        )
+        return user_att_by_occ
+    
 class SessionParticipantsView(APIView):
     """
     GET /api/leagues/session/{session_id}/participants/
@@ -197,26 +287,23 @@ class SessionParticipantsView(APIView):
         # 1. Verify session exists (returns 404 if not found)
         session = get_object_or_404(SessionOccurrence, id=session_id)
         
-        # 2. Get all ATTENDING participants for this session
-        attendances = LeagueAttendance.objects.filter(
-            session_occurrence=session,
-            status=LeagueAttendanceStatus.ATTENDING
-        ).select_related(
-            'league_participation__member'  # Optimize: Avoid N+1 queries
-        )
-        
-        # 3. Extract the member (User) from each LeagueAttendance
-        participants = [
-            attendance.league_participation.member 
-            for attendance in attendances
-        ]
-        
-        # 4. Serialize the data
+        # 2. Get all ATTENDING members (Users) for this session
+        # ⚡ ONE query straight on User - no LeagueAttendance rows / Python
+        # list built in between, serializer reads the queryset directly
+        participants = User.objects.filter(
+            league_participations__attendance_records__session_occurrence=session,
+            league_participations__attendance_records__status=LeagueAttendanceStatus.ATTENDING
+        ).order_by(
+            'id'  # Member order - one league per session, so same as (league, member)
+        ).distinct()
+        
+        # 3. Serialize the data
         serializer = UserDetailSerializer(participants, many=True)
+        data = serializer.data  # Evaluates the queryset once
         response_data = {
             'session_id': session_id,
-            'count': len(participants),
-            'participants': serializer.data
+            'count': len(data),  # ⚡ No extra COUNT query
+            'participants': data
         }
         
         return Response(response_data, status=status.HTTP_200_OK)
@@ -224,11 +311,11 @@ class SessionParticipantsView(APIView):
 class AdminEventsViewSet(viewsets.ModelViewSet):
 
     permission_classes = [IsLeagueAdmin]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]  # Tells DRF HOW to filter -> DRF says: "Use django-filter!"
+    filter_backends = [OptionalDjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]  # Tells DRF HOW to filter -> DRF says: "Use django-filter!"
     filterset_class = LeagueFilter # tells DRF WHAT to filter
     ordering_fields = ['start_date', 'name', 'created_at']  # ✅ Adjust per model
     ordering = ['name']
-    search_fields = ['name', 'description', 'captain__get_full_name']
+    search_fields = ['name', 'description', 'captain__first_name', 'captain__last_name']
     # pagination_class = StandardPagination
 
     def get_serializer_class(self):
@@ -252,22 +339,18 @@ class AdminEventsViewSet(viewsets.ModelViewSet):
             'minimum_skill_level',
             'captain',
         )
-        if self.request.user.is_authenticated:
-            user = self.request.user
-            queryset = queryset.annotate(
-                user_is_captain=Case(
-                    When(captain=user, then=True),
-                        default=False,
-                        output_field=BooleanField()
+        # ✅ user_is_captain: computed by AdminLeagueListSerializer from captain_id
+        # ⚡ Active participant count (AdminLeagueListSerializer needs it!)
+        queryset = queryset.with_counts()
+
+        # ⚡ PREFETCH: Detail shows league_sessions with their court location
+        if self.action != 'list':
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    'sessions',
+                    queryset=LeagueSession.objects.select_related('court_location__address')
                 )
             )
-        queryset = queryset.annotate(
-            league_participants_count=Count(
-                'league_participants',
-                filter=Q(league_participants__status=LeagueParticipationStatus.ACTIVE), 
-                distinct=True
-            )
-        )
 
         return queryset
 
@@ -287,6 +370,8 @@ class AdminEventsViewSet(viewsets.ModelViewSet):
         to renew their membership before joining the league!
         That's why membership status is shown in the table!
         
+        PAGINATION (optional): ?page=N / ?page_size=N → {count, next, previous, results}
+        
         RETURNS: [
             {
                 "id": 1,
@@ -313,7 +398,7 @@ class AdminEventsViewSet(viewsets.ModelViewSet):
                 MembershipStatus.ACTIVE,
                 MembershipStatus.SUSPENDED,
             ]
-        ).select_related('member').prefetch_related('levels')
+        )
         
         # ========================================
         # STEP 2: Filter by skill level at DB level (OPTIMIZATION!)
@@ -335,10 +420,11 @@ class AdminEventsViewSet(viewsets.ModelViewSet):
         # BEFORE: Loop through and check each one (slow!)
         # NOW: One DB query with exclude (fast!)
         
-        # Get IDs of members already participating (ACTIVE or PENDING)
+        # Members already participating (ACTIVE or PENDING)
         # NOTE: CANCELLED members CAN be re-added, so don't exclude them!
-        existing_participant_ids = LeagueParticipation.objects.filter(
+        existing_participation = LeagueParticipation.objects.filter(
             league=league,
+            member_id=OuterRef('member_id'),
             status__in=[
                 LeagueParticipationStatus.ACTIVE,
                 LeagueParticipationStatus.PENDING,
@@ -346,11 +432,12 @@ class AdminEventsViewSet(viewsets.ModelViewSet):
                 LeagueParticipationStatus.HOLIDAY,
                 LeagueParticipationStatus.INJURED,
             ]
-        ).values_list('member_id', flat=True)
+        )
         
         # Exclude existing participants
         # ✅ FIXED: member_id not user_id (ClubMembership FK is 'member')
-        club_memberships = club_memberships.exclude(member_id__in=existing_participant_ids)
+        # ⚡ NOT EXISTS (anti-join) instead of NOT IN (SELECT member_id ...)
+        club_memberships = club_memberships.filter(~Exists(existing_participation))
         
         # ========================================
         # STEP 4: Build response (already filtered!)
@@ -358,19 +445,49 @@ class AdminEventsViewSet(viewsets.ModelViewSet):
         # NOTE: No need to loop and call can_user_join!
         # We already filtered at DB level - much more efficient!
         
+        # ⚡ values(): only the columns in the response - no ClubMembership /
+        # User objects or UserInfoSerializer instance built per member!
+        rows = club_memberships.values(
+            'id', 'status',
+            'member__id', 'member__first_name', 'member__last_name',
+            'member__username', 'member__profile_picture_url', 'member__email',
+        )
+        
+        # ⚡ Opt-in pagination (?page=N / ?page_size=N) caps the response for
+        # big clubs - without it: plain list (frontend EligibleMember[])
+        paginator = None
+        if (StandardPagination.page_query_param in request.query_params
+                or StandardPagination.page_size_query_param in request.query_params):
+            paginator = StandardPagination()
+            rows = paginator.paginate_queryset(rows, request, view=self)
+        else:
+            # ⚡ Stream the rows - no queryset result cache for the whole club
+            rows = rows.iterator(chunk_size=500)
+        
         eligible_members = []
-        for membership in club_memberships:
-            user_info = UserInfoSerializer(membership.member).data
+        for membership in rows:
+            first_name = membership['member__first_name']
+            last_name = membership['member__last_name']
             eligible_members.append({
-                'id': membership.id,  # ✅ FIXED: Return ClubMembership ID, not User ID!
-                'user_info': user_info,
-                'email': membership.member.email,  # ✅ FIXED: .member not .user!
-                'status': membership.status,  # "Active" or "Suspended"
+                'id': membership['id'],  # ✅ FIXED: Return ClubMembership ID, not User ID!
+                # Same fields as UserInfoSerializer
+                'user_info': {
+                    'id': membership['member__id'],
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'full_name': f'{first_name} {last_name}'.strip(),  # = get_full_name()
+                    'username': membership['member__username'],
+                    'profile_picture_url': membership['member__profile_picture_url'],
+                },
+                'email': membership['member__email'],  # ✅ FIXED: .member not .user!
+                'status': membership['status'],  # "Active" or "Suspended"
             })
         
+        if paginator is not None:
+            return paginator.get_paginated_response(eligible_members)
         return Response(eligible_members)
 
-class AdminLeagueParticipantsViewSet(viewsets.ModelViewSet):
+class AdminLeagueParticipantsViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     '''
     CRUD operations for League Participants (ADMIN endpoint)
     
@@ -396,7 +513,7 @@ class AdminLeagueParticipantsViewSet(viewsets.ModelViewSet):
     '''
     # pagination_class = StandardPagination
     permission_classes = [IsLeagueAdmin]
-    filter_backends=[DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends=[OptionalDjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class=ParticipationFilter
     search_fields = [
         'member__first_name',
@@ -425,15 +542,26 @@ class AdminLeagueParticipantsViewSet(viewsets.ModelViewSet):
 
         queryset = super().get_queryset()
 
-        # ✅ PREFETCH: Related data (member (User), club_membership)
-        queryset = queryset.select_related(
-            'member',
-            'club_membership',
-        ).prefetch_related(
-            'club_membership__roles',
-            'club_membership__levels',
-        )
-        return queryset
+        # ⚡ destroy serializes nothing - no JOINs / prefetches needed
+        if self.action == 'destroy':
+            return queryset
+
+        # ✅ PREFETCH: club_membership (+ club, member, type, roles, levels)
+        # is derived from the nested AdminClubMembershipSerializer by
+        # AutoPrefetchMixin - every other action (incl. the bulk ones)
+        # returns serialized participants!
+        return self.auto_prefetch(queryset)
+    
+    def check_leagues_permissions(self, request, leagues):
+        """
+        Bulk check_object_permissions() for the leagues touched by a bulk action
+        
+        ⚡ Each permission checks ALL leagues at once (has_leagues_permission)
+        instead of check_object_permissions() once per league
+        """
+        for permission in self.get_permissions():
+            if not permission.has_leagues_permission(request, leagues):
+                self.permission_denied(request)
     
     # ========================================
     # BUILT-IN PATCH ENDPOINT (FREE!)
@@ -485,12 +613,13 @@ class AdminLeagueParticipantsViewSet(viewsets.ModelViewSet):
         
         RESPONSE:
         {
-            "created": 5
+            "created": 5  # members added (new) or re-added (CANCELLED → PENDING)
         }
         """
         # league = get_object_or_404(League, id=league_id)
         league_id = request.query_params.get('league')  # ✅ From URL!
-        member_ids = request.data.get('member_ids', [])
+        # ⚡ Duplicate ids (double clicks, merged selections) dropped up front
+        member_ids = list(set(request.data.get('member_ids', [])))
         
         # ========================================
         # VALIDATION: Basic checks
@@ -517,15 +646,15 @@ class AdminLeagueParticipantsViewSet(viewsets.ModelViewSet):
         
         # ✅ FIXED: Get ClubMemberships (not Users!)
         # Frontend sends ClubMembership IDs, not User IDs!
-        # ✅ FIXED: select_related('member') not 'user'!
-        club_memberships = ClubMembership.objects.filter(id__in=member_ids).select_related('member')
+        # ⚡ Only the two ids needed - no User JOIN / full ClubMembership rows
+        club_memberships = ClubMembership.objects.filter(id__in=member_ids).values_list('id', 'member_id')
         
         participations = []
-        for membership in club_memberships:
+        for membership_id, member_id in club_memberships:
             participation = LeagueParticipation(
-                league=league,
-                member=membership.member,  # ✅ User FK (field is 'member' in ClubMembership!)
-                club_membership=membership,  # ✅ ClubMembership FK
+                league_id=league.id,
+                member_id=member_id,  # ✅ User FK (field is 'member' in ClubMembership!)
+                club_membership_id=membership_id,  # ✅ ClubMembership FK
                 status=LeagueParticipationStatus.PENDING,
                 # Let model defaults handle:
                 # - joined_at (auto_now_add)
@@ -550,6 +679,7 @@ class AdminLeagueParticipantsViewSet(viewsets.ModelViewSet):
             update_conflicts=True,  # ✅ Update if conflict
             update_fields=['status'],  # ✅ Only update status field
             unique_fields=['club_membership', 'league'],  # ✅ Conflict on these fields
+            batch_size=500,  # ⚡ Bounded statement size (query parameter limits)
         )
 
         # ========================================
@@ -559,6 +689,7 @@ class AdminLeagueParticipantsViewSet(viewsets.ModelViewSet):
         # serializer = AdminLeagueParticipationSerializer(created_participations, many=True)
         
         return Response({
+            # One upserted row per distinct ClubMembership found
             "created": len(participations),
         #    "participants": serializer.data
         }, status=status.HTTP_200_OK)
@@ -619,9 +750,13 @@ class AdminLeagueParticipantsViewSet(viewsets.ModelViewSet):
         
         # Get all participations (with prefetch from get_queryset!)
         # participations = LeagueParticipation.objects.filter(id__in=participation_ids)
-        participations = self.get_queryset().filter(id__in=participation_ids)
+        # ⚡ Evaluated ONCE (list) - no separate EXISTS query
+        # league (+ club): read by the permission check + attendance services
+        participations = list(self.get_queryset().filter(
+            id__in=participation_ids
+        ).select_related('league__club'))
         
-        if not participations.exists():
+        if not participations:
             return Response(
                 {'error': 'No participations found'},
                 status=status.HTTP_404_NOT_FOUND
@@ -631,11 +766,10 @@ class AdminLeagueParticipantsViewSet(viewsets.ModelViewSet):
         # ✅ SECURITY: Verify user is admin for ALL leagues involved
         # (IsLeagueAdmin permission checks this per-league)
         # For bulk updates, we need to verify user has admin access to ALL leagues
-        unique_leagues = set(p.league for p in participations)
-        for league in unique_leagues:
-            # Check if user has admin permission for THIS league
-            # IsLeagueAdmin.has_object_permission() will raise PermissionDenied if not admin
-            self.check_object_permissions(request, league)
+        # ⚡ Leagues already loaded with the participations - no extra query
+        unique_leagues = {p.league_id: p.league for p in participations}.values()
+        # ⚡ ONE membership query for all clubs (raises PermissionDenied if not admin)
+        self.check_leagues_permissions(request, unique_leagues)
         
         # ✅ CORRECT PATTERN: Use serializer for validation + bulk update
         serializer = BulkLeagueParticipationStatusSerializer(
@@ -726,10 +860,13 @@ class AdminLeagueParticipantsViewSet(viewsets.ModelViewSet):
         # ========================================
         # 🚨 SECURITY CHECK: Verify admin for ALL leagues!
         # ========================================
-        unique_leagues = set(p.league for p in participations)
+        # ⚡ Distinct leagues (only club_id is read) + ONE membership query
+        # for all their clubs, instead of 2 queries per league
+        unique_leagues = League.objects.filter(
+            id__in=participations.values('league_id')
+        ).only('id', 'club_id')
         
-        for league in unique_leagues:
-            self.check_object_permissions(request, league)
+        self.check_leagues_permissions(request, unique_leagues)
         
         # ✅ Use STANDARD serializer for generic updates!
         serializer = AdminLeagueParticipationSerializer(
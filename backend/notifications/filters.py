@@ -156,7 +156,7 @@ class AnnouncementFilter(django_filters.FilterSet):
         active=true  → expiry_date is null OR expiry_date >= today
         active=false → expiry_date < today
         """
-        today = timezone.localtime().date()
+        today = timezone.localdate()
         
         if value:  # active=true
             return queryset.filter(
@@ -75,7 +75,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
         }
         """
         user = request.user
-        today = timezone.localtime().date()
+        today = timezone.localdate()
         
         # Get ALL notifications (including private ones without club_id!)
         notifications = self.get_queryset()
@@ -158,7 +158,7 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        today = timezone.localtime().date()
+        today = timezone.localdate()
 
         # Get clubs user is member of
         user_clubs = user.club_memberships.values_list('club', flat=True)
@@ -0,0 +1,38 @@
+# public/filters.py
+
+"""
+Shared filter backends for all ViewSets
+
+DEFINE ONCE, REUSE EVERYWHERE!
+"""
+
+from django_filters.rest_framework import DjangoFilterBackend
+
+
+class OptionalDjangoFilterBackend(DjangoFilterBackend):
+    """
+    DjangoFilterBackend that skips the FilterSet when no filter params are sent
+
+    WHY: The plain backend builds + validates the FilterSet form on EVERY
+    request - even the common unfiltered list (?page=2, ?ordering=name)!
+    ⚡ No filter param → queryset returned untouched, no form constructed
+
+    Usage:
+    ```python
+    from public.filters import OptionalDjangoFilterBackend
+
+    class YourViewSet(viewsets.ModelViewSet):
+        filter_backends = [OptionalDjangoFilterBackend, filters.SearchFilter]
+        filterset_class = YourFilter
+    ```
+    """
+    def filter_queryset(self, request, queryset, view):
+        filterset_class = self.get_filterset_class(view, queryset)
+        if filterset_class is None:
+            return queryset
+
+        query_params = request.query_params
+        if not any(name in query_params for name in filterset_class.base_filters):
+            return queryset
+
+        return super().filter_queryset(request, queryset, view)
@@ -0,0 +1,110 @@
+"""
+Shared ViewSet Mixins
+
+Reusable mixin classes for ViewSets.
+Follows DRY principle - DEFINE ONCE, REUSE EVERYWHERE!
+
+Created: 2026-10-17
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+def get_related_lookups(serializer, model, prefix=(), many=False):
+    """
+    Walk a serializer's field sources and collect the relations it reads.
+
+    Returns: (select_related, prefetch_related) - two sets of '__' lookups
+
+    Example (AdminLeagueParticipationSerializer on LeagueParticipation):
+        participant = AdminClubMembershipSerializer(source='club_membership')
+            club_info = ClubInfoSerializer(source='club')   → select 'club_membership__club'
+            roles = RoleSerializer(many=True)               → prefetch 'club_membership__roles'
+
+    RULES:
+    - FK / OneToOne → select_related (JOIN in the main query)
+    - ManyToMany / reverse FK → prefetch_related (1 extra query per relation)
+    - Anything BELOW a many-relation must be prefetched too!
+    - SerializerMethodFields are invisible here - select those manually
+    """
+    select_related, prefetch_related = set(), set()
+
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+
+        # many=True wraps the nested serializer in a ListSerializer
+        nested = field.child if isinstance(field, serializers.ListSerializer) else field
+
+        # source='*' passes the SAME object to a nested serializer
+        if field.source == '*':
+            if isinstance(nested, serializers.BaseSerializer):
+                nested_select, nested_prefetch = get_related_lookups(nested, model, prefix, many)
+                select_related |= nested_select
+                prefetch_related |= nested_prefetch
+            continue
+
+        current_model, path, path_many = model, list(prefix), many
+        for index, attr in enumerate(field.source_attrs):
+            try:
+                model_field = current_model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                break  # property / method → stop walking
+            if not model_field.is_relation or model_field.related_model is None:
+                break
+            if attr != model_field.name:
+                break  # 'league_id' → raw FK column, not the relation
+
+            path.append(attr)
+            path_many = path_many or model_field.many_to_many or model_field.one_to_many
+            current_model = model_field.related_model
+
+            # PrimaryKeyRelatedField on a FK only reads <fk>_id - no JOIN needed
+            is_last = index == len(field.source_attrs) - 1
+            if is_last and not path_many and isinstance(field, serializers.PrimaryKeyRelatedField):
+                break
+
+            (prefetch_related if path_many else select_related).add('__'.join(path))
+        else:
+            # Whole source is a relation → follow into the nested serializer
+            if path and isinstance(nested, serializers.BaseSerializer):
+                nested_select, nested_prefetch = get_related_lookups(nested, current_model, path, path_many)
+                select_related |= nested_select
+                prefetch_related |= nested_prefetch
+
+    return select_related, prefetch_related
+
+
+class AutoPrefetchMixin:
+    """
+    Mixin to derive select_related/prefetch_related from the serializer.
+
+    ✅ USE THIS instead of hand-maintaining select_related lists that drift
+    out of sync with nested serializers (→ N+1 per row)!
+
+    Call it at the END of the ViewSet's get_queryset(), so explicit
+    Prefetch() objects (custom querysets / to_attr) are registered first
+    and still win.
+
+    Usage:
+        class MyViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
+            def get_queryset(self):
+                # Only what the serializer can't see (SerializerMethodFields!)
+                queryset = League.objects.select_related('captain')
+                return self.auto_prefetch(queryset)
+    """
+    def auto_prefetch(self, queryset):
+        """Apply select_related/prefetch_related derived from get_serializer_class()"""
+        # Minimal context - get_serializer_context() may run queries!
+        serializer = self.get_serializer_class()(
+            context={'request': self.request, 'view': self}
+        )
+        select_related, prefetch_related = get_related_lookups(serializer, queryset.model)
+
+        if select_related:
+            queryset = queryset.select_related(*sorted(select_related))
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*sorted(prefetch_related))
+
+        return queryset
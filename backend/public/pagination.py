@@ -6,15 +6,36 @@ Shared pagination classes for all ViewSets
 DEFINE ONCE, REUSE EVERYWHERE!
 """
 
+import hashlib
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
 from rest_framework.pagination import PageNumberPagination
 
+COUNT_CACHE_VERSION_KEY = 'pagination_count:version'
+
+
+def invalidate_cached_counts():
+    """
+    Drop EVERY cached COUNT(*) (bumps the version in CachedCountPaginator keys)
+    
+    Called from post_save/post_delete of the models the cached lists count
+    (leagues/models.py) - so a new/edited/deleted row shows up right away
+    """
+    try:
+        cache.incr(COUNT_CACHE_VERSION_KEY)
+    except ValueError:  # Version key missing/evicted → skip past the default 1
+        cache.set(COUNT_CACHE_VERSION_KEY, 2, timeout=None)
+
+
 class StandardPagination(PageNumberPagination):
     """
     Standard pagination for all list endpoints
     
     Used by:
     - ClubViewSet (clubs/views.py)
-    - LeagueViewSet (leagues/views.py)
+    - LeagueViewSet (leagues/views.py - via CachedCountPagination)
     - Any other ViewSet that needs pagination
     
     Settings:
@@ -33,3 +54,48 @@ class StandardPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that caches COUNT(*) per query (see CachedCountPagination)
+    
+    ⚡ Key = md5 of the SQL (filters + params included), so every filter /
+    search combination gets its own count - only paging reuses it!
+    
+    ⚠️ Keys carry a version bumped by invalidate_cached_counts() - writes
+    that skip signals (queryset.update(), bulk_create) lag up to
+    count_cache_timeout instead
+    """
+    count_cache_timeout = 60  # seconds
+    
+    @cached_property
+    def count(self):
+        """Total number of objects - from cache when the same query was counted recently"""
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return super().count  # Plain list - len() is free
+        
+        sql = str(query).encode()
+        digest = hashlib.md5(sql, usedforsecurity=False).hexdigest()  # Cache key, not security
+        version = cache.get_or_set(COUNT_CACHE_VERSION_KEY, 1, timeout=None)
+        key = f'pagination_count:{version}:{digest}'
+        count = cache.get(key)
+        if count is None:
+            count = super().count
+            cache.set(key, count, self.count_cache_timeout)
+        return count
+
+
+class CachedCountPagination(StandardPagination):
+    """
+    StandardPagination that caches the total COUNT(*) for a short time
+    
+    WHY: Every page request re-runs the list COUNT - paging through the
+    same filtered list reuses it instead (dropped on every save/delete of
+    the counted models, bulk writes may lag up to 60s!)
+    
+    Used by:
+    - LeagueViewSet (leagues/views.py)
+    """
+    django_paginator_class = CachedCountPaginator
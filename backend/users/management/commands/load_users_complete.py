@@ -645,7 +645,7 @@ class Command(BaseCommand):
         ENTIRE SEASON, so we create attendance records for all upcoming sessions!
         """
         
-        today = timezone.localtime().date()
+        today = timezone.localdate()
         
         # Get all future session occurrences for this league
         future_occurrences = SessionOccurrence.objects.filter(
@@ -188,7 +188,7 @@ def user_activities_view(request):
         leagues = League.objects.filter(
             id__in=all_league_ids,
             is_active=True
-        ).select_related('captain', 'club')
+        ).select_related('captain', 'club').with_recurring_sessions()
         
         for league in leagues:
             # ✅ Simple set membership checks - O(1) lookup!
@@ -201,9 +201,7 @@ def user_activities_view(request):
                 sessions = SessionOccurrence.objects.filter(
                     league=league,
                     is_cancelled=False
-                ).select_related(
-                    'league_session__court_location'
-                ).order_by('session_date', 'start_datetime')
+                ).for_serializer().order_by('session_date', 'start_datetime')
                 
             elif user_is_participant:
                 # PARTICIPANT: Show ONLY sessions they're attending!
@@ -213,9 +211,7 @@ def user_activities_view(request):
                     is_cancelled=False,
                     attendances__league_participation__member=user,
                     attendances__status=LeagueAttendanceStatus.ATTENDING
-                ).distinct().select_related(
-                    'league_session__court_location'
-                ).order_by('session_date', 'start_datetime')
+                ).distinct().for_serializer().order_by('session_date', 'start_datetime')
                 
             else:
                 # Should never happen (league in all_league_ids but user not captain/participant?)